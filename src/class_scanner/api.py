@@ -2,14 +2,14 @@ from pathlib import Path
 import logging
 from typing import Callable, Dict, Optional, Union
 from .cache import ClassCache
-from .scanner import Scanner
+from .scanner import Scanner, find_pbo_files
 from .models import PboScanData
 
 logger = logging.getLogger(__name__)
 
 def _normalize_path(path: Union[str, Path]) -> str:
     """Convert path to normalized string format."""
-    return str(Path(path).absolute())
+    return str((path if isinstance(path, Path) else Path(path)).absolute())
 
 class ClassAPI:
     """Main API class for class scanning functionality"""
@@ -45,12 +45,14 @@ class ClassAPI:
 
     def scan_directory(self, directory: Union[str, Path], file_limit: Optional[int] = None) -> Dict[str, PboScanData]:
         """Scan a directory for PBO files and their classes"""
-        directory = Path(directory)
-        if not directory.exists() or not directory.is_dir():
+        try:
+            pbo_files = [Path(entry.path) for entry in find_pbo_files(directory)]
+        except OSError:
             return {}
 
         results: Dict[str, PboScanData] = {}
-        pbo_files = list(directory.rglob('*.pbo'))[:file_limit] if file_limit else list(directory.rglob('*.pbo'))
+        if file_limit:
+            pbo_files = pbo_files[:file_limit]
 
         for pbo_file in pbo_files:
             if self._progress_callback:
@@ -66,24 +68,32 @@ class ClassAPI:
 
     def scan(self, pbo_path: Union[str, Path]) -> Optional[PboScanData]:
         """Scan a single PBO file for class definitions"""
-        pbo_path = Path(pbo_path)
+        if not isinstance(pbo_path, Path):
+            pbo_path = Path(pbo_path)
         if not pbo_path.exists():
             logger.debug("Invalid file path: %s", pbo_path)
             return None
 
-        normalized_path = _normalize_path(pbo_path)
-
-        # Check cache first
-        if cached := self.cache.get(normalized_path):
+        # Check cache first; the key is normalized once for lookup and store
+        key = _normalize_path(pbo_path)
+        if cached := self.cache.get(key):
             return cached
 
         # Scan if not in cache
         if result := self.scanner.scan_pbo(pbo_path):
-            self.cache.add(normalized_path, result)
+            self.cache.add(key, result)
             return result
 
         return None
 
+    def get_cached(self, pbo_path: Union[str, Path]) -> Optional[PboScanData]:
+        """Return the cached scan result for a PBO file, if any"""
+        return self.cache.get(_normalize_path(pbo_path))
+
+    def add_result(self, pbo_path: Union[str, Path], result: PboScanData) -> None:
+        """Cache a scan result produced outside this API (e.g. in a worker process)"""
+        self.cache.add(_normalize_path(pbo_path), result)
+
     def save_cache(self) -> None:
         """Save cache to configured location."""
         if self.cache_file:
@@ -1,8 +1,14 @@
 import logging
-from typing import Dict, Optional, Union, overload, Iterable, TypeVar, Tuple, cast
+from typing import Any, Dict, Optional, Union, overload, Iterable, TypeVar, Tuple, cast
 from pathlib import Path
 from datetime import datetime, timedelta
 import json
+import mmap
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from .models import PboScanData, ClassData, CacheFileStructure
 
@@ -110,20 +116,32 @@ class ClassCache:
             }
         }
         
-        with cache_file.open('w') as f:
-            json.dump(cache_data, f, indent=2)
+        if orjson is not None:
+            cache_file.write_bytes(orjson.dumps(cache_data, option=orjson.OPT_INDENT_2))
+        else:
+            with cache_file.open('w') as f:
+                json.dump(cache_data, f, indent=2)
         
         self._logger.info(f"Cache saved to {cache_file}")
 
+    @staticmethod
+    def _read_cache_file(cache_file: Path) -> Dict[str, Any]:
+        """Decode a cache file through a read-only memory map"""
+        with cache_file.open('rb') as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if orjson is None:
+                    return json.loads(mm[:])
+                with memoryview(mm) as view:
+                    return orjson.loads(view)
+
     @classmethod
     def load_from_disk(cls, cache_file: Path) -> 'ClassCache':
         """Load both caches from disk"""
         logger = logging.getLogger(__name__)
         
         try:
-            with cache_file.open('r') as f:
-                data = json.load(f)
-                
+            data = cls._read_cache_file(cache_file)
+
             cache = cls(max_cache_size=data['max_cache_size'])
             cache._last_updated = datetime.fromisoformat(data['last_updated'])
             
@@ -1,6 +1,6 @@
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, Optional, Any, List, TypedDict
+from typing import Dict, Optional, Any, List, Sequence, Tuple, TypedDict
 from enum import Enum, auto
 from datetime import datetime
 
@@ -27,13 +27,14 @@ class PropertyValueType(Enum):
     BOOLEAN = auto()
     IDENTIFIER = auto()
 
-@dataclass
+# Slotted: a full scan creates one instance per property
+@dataclass(slots=True)
 class PropertyValue:
     name: str = ""
     raw_value: str = ""
     value_type: Optional[PropertyValueType] = None
     is_array: bool = False
-    array_values: List[str] = field(default_factory=list)
+    array_values: Tuple[str, ...] = ()
 
     def __init__(
         self, 
@@ -41,13 +42,13 @@ class PropertyValue:
         raw_value: str = "", 
         value_type: Optional[PropertyValueType] = None,
         is_array: bool = False,
-        array_values: Optional[List[str]] = None
+        array_values: Optional[Sequence[str]] = None
     ) -> None:
         self.name = name
         self.raw_value = raw_value
         self.value_type = value_type
         self.is_array = is_array
-        self.array_values = array_values or []
+        self.array_values = tuple(array_values) if array_values else ()
 
     @property
     def value(self) -> str:
@@ -58,7 +59,7 @@ class PropertyValue:
         """Allow direct comparison with strings"""
         if isinstance(other, str):
             return self.raw_value == other
-        return super().__eq__(other)
+        return object.__eq__(self, other)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to serializable dictionary"""
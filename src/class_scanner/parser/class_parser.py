@@ -1,4 +1,5 @@
 import re
+import sys
 from typing import Dict, Optional, Any, cast, Tuple, TypeVar, List
 from pathlib import Path
 import logging
@@ -12,6 +13,13 @@ from ..constants import ConfigSectionName, CFG_PATCHES, CFG_WEAPONS, CFG_VEHICLE
 
 logger = logging.getLogger(__name__)
 
+# Quoted strings are matched whole so braces inside them are not counted
+_BLOCK_TOKEN_RE = re.compile(r'"[^"]*"|\'[^\']*\'|[{}]')
+# Class headers; searched from a position rather than on text[pos:] slices,
+# which would copy the remaining file for every class found
+_CLASS_HEADER_RE = re.compile(r'class\s+(\w+)(?:\s*:\s*(\w+))?\s*({|;)')
+_CLASS_BLOCK_HEADER_RE = re.compile(r'class\s+(\w+)(?:\s*:\s*(\w+))?\s*{')
+
 T = TypeVar('T')
 
 class ClassParser:
@@ -64,12 +72,12 @@ class ClassParser:
             pos = start
 
             while pos < len(text):
-                match = re.search(r'class\s+(\w+)(?:\s*:\s*(\w+))?\s*({|;)', text[pos:])
+                match = _CLASS_HEADER_RE.search(text, pos)
                 if not match:
                     break
 
-                class_name = match.group(1)
-                parent = match.group(2) or ''
+                class_name = sys.intern(match.group(1))
+                parent = sys.intern(match.group(2)) if match.group(2) else ''
                 has_block = match.group(3) == '{'
                 
                 # Determine section based on class name and context
@@ -78,7 +86,7 @@ class ClassParser:
                            class_name, parent, target_section)
 
                 if has_block:
-                    block_start = pos + match.end() - 1
+                    block_start = match.end() - 1
                     block, block_end = self._extract_class_block(text, block_start)
                     logger.debug("Extracted block for %s, length: %d", class_name, len(block))
                     
@@ -107,7 +115,7 @@ class ClassParser:
 
                     pos = block_end + 1
                 else:
-                    pos += match.end()
+                    pos = match.end()
                     logger.debug("Added empty class %s", class_name)
                     classes[class_name] = {
                         'parent': parent,
@@ -150,13 +158,13 @@ class ClassParser:
         
         while pos < len(content):
             # Find next class definition (case sensitive)
-            match = re.search(r'class\s+(\w+)(?:\s*:\s*(\w+))?\s*{', content[pos:])
+            match = _CLASS_BLOCK_HEADER_RE.search(content, pos)
             if not match:
                 break
                 
-            class_name = match.group(1)
-            parent = match.group(2)
-            class_start = pos + match.start()
+            class_name = sys.intern(match.group(1))
+            parent = sys.intern(match.group(2)) if match.group(2) else None
+            class_start = match.start()
             
             # Extract complete class block
             block_text, end_pos = self._extract_class_block(content, class_start)
@@ -229,33 +237,18 @@ class ClassParser:
         """Extract a single class block without parsing nested classes"""
         logger.debug("Extracting class block from position %d", start_pos)
         depth = 0
-        end_pos = start_pos
-        in_string = False
-        string_char = None
-
-        while end_pos < len(content):
-            char = content[end_pos]
-
-            if char in '"\'':
-                if not in_string:
-                    in_string = True
-                    string_char = char
-                elif char == string_char:
-                    in_string = False
-                end_pos += 1
-                continue
-
-            if not in_string:
-                if char == '{':
-                    depth += 1
-                elif char == '}':
-                    depth -= 1
-                    if depth == 0:
-                        return content[start_pos:end_pos+1], end_pos
-
-            end_pos += 1
 
-        return content[start_pos:end_pos], end_pos
+        for match in _BLOCK_TOKEN_RE.finditer(content, start_pos):
+            char = match.group()
+            if char == '{':
+                depth += 1
+            elif char == '}':
+                depth -= 1
+                if depth == 0:
+                    end_pos = match.start()
+                    return content[start_pos:end_pos+1], end_pos
+
+        return content[start_pos:], len(content)
 
     def _add_class_tree(self, section: Dict[str, ClassDict], class_name: str, class_data: Dict[str, Any], prefix: str = '') -> None:
         """Add a class and all its nested classes to the given section"""
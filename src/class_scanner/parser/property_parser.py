@@ -1,6 +1,8 @@
 import logging
 import re
-from typing import Dict, List, Optional, Tuple
+import sys
+from functools import lru_cache
+from typing import Dict, Iterator, List, Optional, Set, Tuple
 
 from class_scanner.models import PropertyValue, PropertyValueType
 
@@ -9,74 +11,187 @@ from class_scanner.parser.property_types import PropertyTypeDetector
 
 logger = logging.getLogger(__name__)
 
+# Structural tokens of a class body. Strings are matched so that braces,
+# semicolons and equals signs inside them are never treated as structure.
+_TOKEN_RE = re.compile(
+    r'(?P<STRING>"(?:[^"\n]|"")*")'
+    r'|(?P<LBRACE>\{)'
+    r'|(?P<RBRACE>\})'
+    r'|(?P<SEMI>;)'
+    r'|(?P<EQ>=)'
+)
+# Comments, skipping over string literals so "//" inside a path survives
+_COMMENT_RE = re.compile(r'("(?:[^"\n]|"")*")|//[^\n]*|/\*.*?\*/', re.DOTALL)
+_NAME_RE = re.compile(r'(\w+)\s*(\[\])?\s*$')
+_NUMBER_RE = re.compile(r'^-?\d+(\.\d+)?$')
+# Scalar value classifier: one fullmatch picks the type, anything else is
+# an identifier. Every branch is linear, so malformed values cannot make
+# it backtrack.
+_SCALAR_RE = re.compile(
+    r'(?P<STRING>".*")'
+    r'|(?P<BOOLEAN>(?ai:true|false))'
+    r'|(?P<NUMBER>-?\d+(?:\.\d+)?)',
+    re.DOTALL
+)
+# Frequent scalar values share one string object across all properties
+_COMMON_VALUES = {v: v for v in ('true', 'false', '', '0', '1', '2')}
+
+_ARRAY_TOKEN_RE = re.compile(r'"[^"]*"|[{},]')
+_PROPERTY_NAME_RE = re.compile(r'^[a-zA-Z_]\w*(?:\[\])?$')
+_IDENT_RE = re.compile(r'^[a-zA-Z_]\w*$')
+_PATH_RE = re.compile(r'^[\\\/a-zA-Z0-9_\.]+$')
+
+
+def _strip_comment(match: re.Match) -> str:
+    """Keep string literals, blank out comments"""
+    return match.group(1) or ' '
+
 
 class PropertyParser:
-    def __init__(self):
-        self.tokenizer = PropertyTokenizer()
-        self.type_detector = PropertyTypeDetector()
-        self.property_pattern = re.compile(r'(\w+)(?:\[\])?\s*=\s*("[^"]*"|[^;{\s]+)')
+    # Set PropertyParser.enable_memoization = True to parse identical blocks
+    # (CfgPatches boilerplate, repeated base classes) only once. Off by
+    # default: the cache is keyed on the whole block text, nested classes
+    # included, so it keeps large section strings alive.
+    enable_memoization = False
+
+    # Stateless helpers shared by every instance
+    tokenizer = PropertyTokenizer()
+    type_detector = PropertyTypeDetector()
+
+    __slots__ = ()
 
     def parse_block_properties(self, block: str) -> Dict[str, PropertyValue]:
         """Parse properties from a class block, handling nested classes and inheritance"""
+        if self.enable_memoization:
+            # Cached values are shared by every equal block; hand out copies
+            # so callers can modify their properties independently
+            return {
+                name: PropertyValue(prop.name, prop.raw_value, prop.value_type,
+                                    prop.is_array, prop.array_values)
+                for name, prop in _parse_block_cached(block)
+            }
+        return self._parse_block(block)
+
+    @staticmethod
+    def memoization_info():
+        """Hit/miss statistics of the shared block cache"""
+        return _parse_block_cached.cache_info()
+
+    def _parse_block(self, block: str) -> Dict[str, PropertyValue]:
+        """Parse a block without consulting the memoization cache"""
+        properties = dict(self.parse_properties_iter(block))
+        logger.debug("Final properties: %s", properties)
+        return properties
+
+    def parse_properties_iter(self, block: str,
+                              needed: Optional[Set[str]] = None) -> Iterator[Tuple[str, PropertyValue]]:
+        """Lazily yield (name, PropertyValue) pairs in source order.
+
+        Each name is yielded once: when a property is defined more than once
+        the first definition wins. When `needed` is given only those
+        properties are yielded and parsing stops as soon as each of them has
+        been seen once.
+        """
         logger.debug("Starting to parse block:\n%s", block)
 
-        if block.strip().startswith('class'):
+        if block.strip().startswith(('class', '{')):
             block = self._extract_inner_block(block)
 
         block = self._preprocess_block(block)
         logger.debug("Processing inner block:\n%s", block)
 
-        properties: Dict[str, PropertyValue] = {}
-        
-        # Clean the block of nested class definitions
-        cleaned_block = re.sub(r'class\s+\w+[^;]*{[^}]*}', '', block)
-        
-        # Find array properties first
-        array_pattern = re.compile(r'(\w+)\[\]\s*=\s*({[^;]*});')
-        for match in array_pattern.finditer(cleaned_block):
-            name = match.group(1)
-            array_content = match.group(2)
-            
-            # Parse array values
-            values = self._parse_array_content(array_content)
-            
-            properties[name] = PropertyValue(
+        remaining = set(needed) if needed is not None else None
+        if remaining is not None and not remaining:
+            return
+        seen: Set[str] = set()
+
+        # Walk structural tokens only; everything between them is plain text.
+        # Statements are split on top-level semicolons, nested class bodies
+        # are skipped by tracking brace depth.
+        depth = 0
+        stmt_start = 0
+        eq_pos = -1
+        in_class_body = False
+
+        for match in _TOKEN_RE.finditer(block):
+            kind = match.lastgroup
+            if kind == 'STRING':
+                continue
+
+            if kind == 'EQ':
+                if depth == 0 and eq_pos < 0:
+                    eq_pos = match.start()
+            elif kind == 'LBRACE':
+                if depth == 0 and eq_pos < 0:
+                    in_class_body = True
+                depth += 1
+            elif kind == 'RBRACE':
+                if depth > 0:
+                    depth -= 1
+                if depth == 0 and in_class_body:
+                    in_class_body = False
+                    stmt_start = match.end()
+                    eq_pos = -1
+            elif depth == 0:  # SEMI
+                if eq_pos >= 0:
+                    prop = self._make_property(block[stmt_start:eq_pos], block[eq_pos + 1:match.start()])
+                    if prop is not None:
+                        name = prop.name
+                        if name in seen:  # Keep the first definition
+                            prop = None
+                        else:
+                            seen.add(name)
+                    if prop is not None and (remaining is None or name in needed):
+                        yield name, prop
+                        if remaining is not None:
+                            remaining.discard(name)
+                            if not remaining:
+                                return
+                stmt_start = match.end()
+                eq_pos = -1
+
+    def _make_property(self, name_part: str, value_part: str) -> Optional[PropertyValue]:
+        """Classify a single `name = value` statement"""
+        name_match = _NAME_RE.search(name_part)
+        value = value_part.strip()
+        if not name_match or not value:
+            return None
+
+        name = sys.intern(name_match.group(1))
+        if name_match.group(2):
+            if not value.startswith('{'):
+                return None
+            raw_value = ' '.join(line.strip() for line in value.splitlines() if line.strip())
+            return PropertyValue(
                 name=name,
-                raw_value=array_content,
+                raw_value=raw_value,
                 value_type=PropertyValueType.ARRAY,
                 is_array=True,
-                array_values=values
+                array_values=self._parse_array_content(raw_value)
             )
-        
-        # Find non-array properties
-        simple_pattern = re.compile(r'(\w+)\s*=\s*("[^"]*"|[^;{\s]+);')
-        for match in simple_pattern.finditer(cleaned_block):
-            name = match.group(1)
-            if name not in properties:  # Don't override array properties
-                raw_value = match.group(2)
-                
-                if raw_value.startswith('"') and raw_value.endswith('"'):
-                    value = raw_value[1:-1]
-                    value_type = PropertyValueType.STRING
-                elif raw_value.lower() in ('true', 'false'):
-                    value = raw_value.lower()
-                    value_type = PropertyValueType.BOOLEAN
-                elif re.match(r'^-?\d+(\.\d+)?$', raw_value):
-                    value = raw_value
-                    value_type = PropertyValueType.NUMBER
-                else:
-                    value = raw_value
-                    value_type = PropertyValueType.IDENTIFIER
-                    
-                properties[name] = PropertyValue(
-                    name=name,
-                    raw_value=value,
-                    value_type=value_type,
-                    is_array=False
-                )
 
-        logger.debug("Final properties: %s", properties)
-        return properties
+        if value.startswith('{'):
+            return None
+
+        scalar = _SCALAR_RE.fullmatch(value)
+        kind = scalar.lastgroup if scalar else None
+        if kind == 'STRING':
+            value = value[1:-1]
+            value_type = PropertyValueType.STRING
+        elif kind == 'BOOLEAN':
+            value = value.lower()
+            value_type = PropertyValueType.BOOLEAN
+        elif kind == 'NUMBER':
+            value_type = PropertyValueType.NUMBER
+        else:
+            value_type = PropertyValueType.IDENTIFIER
+
+        return PropertyValue(
+            name=name,
+            raw_value=_COMMON_VALUES.get(value, value),
+            value_type=value_type,
+            is_array=False
+        )
 
     def _extract_inner_block(self, class_text: str) -> str:
         """Extract the inner block of a class definition"""
@@ -92,12 +207,7 @@ class PropertyParser:
 
     def _preprocess_block(self, block: str) -> str:
         """Clean and normalize input text before parsing"""
-        text = re.sub(r'//.*?(?:\n|$)', '\n', block, flags=re.MULTILINE)
-        text = re.sub(r'/\*.*?\*/', '', text, flags=re.DOTALL)
-
-        text = ' '.join(line.strip() for line in text.splitlines() if line.strip())
-
-        return text
+        return _COMMENT_RE.sub(_strip_comment, block)
 
     def _parse_property(self, line: str) -> Optional[Tuple[str, str, bool, List[str]]]:
         """Parse a property line into (name, value, is_array, array_values)"""
@@ -148,7 +258,7 @@ class PropertyParser:
             return False
 
         name_part = line[:line.find('=')].strip()
-        if not name_part or not re.match(r'^[a-zA-Z_]\w*(?:\[\])?$', name_part):
+        if not name_part or not _PROPERTY_NAME_RE.match(name_part):
             return False
 
         value_part = line[line.find('=')+1:].rstrip(';').strip()
@@ -177,16 +287,16 @@ class PropertyParser:
         if value.startswith('"') and value.endswith('"'):
             return value[1:-1]
 
-        if re.match(r'^-?\d+(\.\d+)?$', value):
+        if _NUMBER_RE.match(value):
             return value
 
         if value.lower() in ('true', 'false'):
             return value.lower()
 
-        if re.match(r'^[a-zA-Z_]\w*$', value):
+        if _IDENT_RE.match(value):
             return value
 
-        if re.match(r'^[\\\/a-zA-Z0-9_\.]+$', value):
+        if _PATH_RE.match(value):
             return value.replace('\\', '\\\\')
 
         return None
@@ -310,42 +420,45 @@ class PropertyParser:
 
     def _parse_array_content(self, content: str) -> List[str]:
         """Parse array content into list of values"""
-        if content.strip() == '{}':
+        content = content.strip()
+        if content == '{}':
             return []
-            
+
         # Remove outer braces
-        content = content.strip()[1:-1].strip()
-        
+        content = content[1:-1].strip()
+
+        # Jump between quotes, braces and commas instead of walking every
+        # character; strings are consumed whole so their commas are kept.
         values = []
-        current = ''
         depth = 0
-        in_string = False
-        
-        for char in content:
-            if char == '"' and not current.endswith('\\'):
-                in_string = not in_string
-                current += char
-            elif not in_string and char == '{':
+        start = 0
+        for match in _ARRAY_TOKEN_RE.finditer(content):
+            char = match.group()
+            if char == '{':
                 depth += 1
-                current += char
-            elif not in_string and char == '}':
+            elif char == '}':
                 depth -= 1
-                current += char
-            elif not in_string and char == ',' and depth == 0:
-                values.append(current.strip())
-                current = ''
-            else:
-                current += char
-                
-        if current:
-            values.append(current.strip())
-            
+            elif char == ',' and depth == 0:
+                values.append(content[start:match.start()].strip())
+                start = match.end()
+
+        if start < len(content):
+            values.append(content[start:].strip())
+
         # Clean up the values
         cleaned = []
         for val in values:
-            val = val.strip()
             if val.startswith('"') and val.endswith('"'):
                 val = val[1:-1]
             cleaned.append(val)
-            
+
         return cleaned
+
+
+_memo_parser = PropertyParser()
+
+
+@lru_cache(maxsize=4096)
+def _parse_block_cached(block: str) -> Tuple[Tuple[str, PropertyValue], ...]:
+    """Memoized block parse; parsing is stateless so results are shared"""
+    return tuple(_memo_parser._parse_block(block).items())
@@ -32,7 +32,7 @@ class PropertyTypeDetector:
         value_type, raw_value, array_values = self._parse_value(value_tokens)
         result.value_type = value_type
         result.raw_value = raw_value
-        result.array_values = array_values
+        result.array_values = tuple(array_values)
         
         return result
 
@@ -1,36 +1,130 @@
 import logging
+import os
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
-from typing import Dict, Optional, Union
+from typing import Dict, List, Optional, Tuple, Type, Union
 
 from class_scanner.models import ClassData, PboScanData
 from class_scanner.parser.class_parser import ClassParser
 from class_scanner.pbo.pbo_extractor import PboExtractor
 logger = logging.getLogger(__name__)
 
+# Scanner instances owned by the current worker process, one per scanner type
+_worker_scanners: Dict[type, 'Scanner'] = {}
+
+
+def _scan_pbo_worker(scanner_type: Type['Scanner'], path: Path) -> Tuple[Path, Optional[PboScanData]]:
+    """Process pool entry point: scan one PBO with this process's scanner"""
+    scanner = _worker_scanners.get(scanner_type)
+    if scanner is None:
+        scanner = _worker_scanners[scanner_type] = scanner_type()
+    return path, scanner.scan_pbo(path)
+
+
+def find_pbo_files(directory: Union[str, Path]) -> List[os.DirEntry]:
+    """Collect the scandir entries of *.pbo files below a directory, depth first
+
+    The extension is matched case-insensitively. Raises OSError if the
+    directory itself cannot be read; unreadable subdirectories are skipped
+    with a warning. The entries cache their stat() result.
+    """
+    pbo_files: List[os.DirEntry] = []
+    # Directory paths are stacked and opened only when popped, so a single
+    # scandir handle is open at a time however wide the tree is
+    root = os.fspath(directory)
+    stack = [root]
+    while stack:
+        path = stack.pop()
+        try:
+            it = os.scandir(path)
+        except OSError as e:
+            if path is root:
+                raise
+            logger.warning(f"Skipping unreadable directory {path}: {e}")
+            continue
+        with it:
+            for entry in it:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name.lower().endswith('.pbo'):
+                        pbo_files.append(entry)
+                except OSError as e:
+                    logger.debug(f"Skipping unreadable entry {entry.path}: {e}")
+    return pbo_files
+
 
 class Scanner:
     """Scanner class for PBO scanning operations"""
     
-    def __init__(self):
+    def __init__(self, cache_size: int = 128):
         self.parser = ClassParser()
         self.extractor = PboExtractor()
+        # Results of unchanged PBOs are reused, keyed on (path, mtime, size).
+        # Only successful scans are kept; cache_size=0 disables the cache.
+        self.cache_size = cache_size
+        self._results: OrderedDict[Tuple[Path, int, int], PboScanData] = OrderedDict()
+
+    def scan_directory(self, directory: Union[str, Path], max_workers: Optional[int] = 1) -> Dict[str, PboScanData]:
+        """Scan a directory for PBO files and their class definitions
 
-    def scan_directory(self, directory: Union[str, Path]) -> Dict[str, PboScanData]:
-        """Scan a directory for PBO files and their class definitions"""
-        directory = Path(directory)
-        if not directory.exists() or not directory.is_dir():
-            logger.debug(f"Directory does not exist or is not a directory: {directory}")
+        By default PBOs are scanned in the calling process. Pass
+        ``max_workers`` > 1 (or None for one per CPU) to scan them in a
+        process pool instead. Pool workers build their own
+        ``type(self)()``, so:
+
+        - on spawn platforms (Windows, macOS) the calling script needs an
+          ``if __name__ == "__main__":`` guard;
+        - this instance's result cache and any replaced attributes (e.g. a
+          custom ``extractor``) are not used;
+        - subclasses must be constructible without arguments.
+        """
+        try:
+            pbo_files = [Path(entry.path) for entry in find_pbo_files(directory)]
+        except OSError as e:
+            logger.debug(f"Cannot scan directory {directory}: {e}")
             return {}
 
         results: Dict[str, PboScanData] = {}
-        for pbo_file in directory.rglob('*.pbo'):
-            if result := self.scan_pbo(pbo_file):
-                results[str(pbo_file)] = result
+
+        if max_workers == 1 or len(pbo_files) <= 1:
+            for pbo_file in pbo_files:
+                if result := self.scan_pbo(pbo_file):
+                    results[str(pbo_file)] = result
+            return results
+
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            scanned = executor.map(_scan_pbo_worker, repeat(type(self)), pbo_files, chunksize=4)
+            for pbo_file, result in scanned:
+                if result:
+                    results[str(pbo_file)] = result
 
         return results
 
     def scan_pbo(self, path: Path) -> Optional[PboScanData]:
         """Scan a PBO file for class definitions"""
+        if not self.cache_size:
+            return self._scan_pbo(path)
+        try:
+            st = os.stat(path)
+        except OSError:
+            return self._scan_pbo(path)
+
+        key = (path, st.st_mtime_ns, st.st_size)
+        if (result := self._results.get(key)) is not None:
+            self._results.move_to_end(key)
+            return result
+
+        if (result := self._scan_pbo(path)) is not None:
+            self._results[key] = result
+            if len(self._results) > self.cache_size:
+                self._results.popitem(last=False)
+        return result
+
+    def _scan_pbo(self, path: Path) -> Optional[PboScanData]:
+        """Extract and parse a PBO without consulting the result cache"""
         try:
             code_files = self.extractor.extract_code_files(path)
             
@@ -108,11 +108,19 @@ def api():
     """Provide API instance"""
     return ClassAPI()
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def parser():
-    """Provide ClassParser instance"""
+    """Provide ClassParser instance (stateless, shared across the session)"""
     return ClassParser()
 
+@pytest.fixture(scope="session")
+def config_sources() -> Dict[str, str]:
+    """Read every TEST_DATA source file once per session"""
+    return {
+        key: data['source_path'].read_text(encoding='utf-8')
+        for key, data in TEST_DATA.items()
+    }
+
 @pytest.fixture
 def test_structure(tmp_path: Path) -> Path:
     """Create minimal test directory structure"""
@@ -121,4 +129,4 @@ def test_structure(tmp_path: Path) -> Path:
     (mod_dir / "addons").mkdir()
     return tmp_path
 
-__all__ = ['sample_configs', 'api', 'parser', 'test_structure', 'TEST_DATA_ROOT']
\ No newline at end of file
+__all__ = ['sample_configs', 'api', 'parser', 'config_sources', 'test_structure', 'TEST_DATA_ROOT']
\ No newline at end of file
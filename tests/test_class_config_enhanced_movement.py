@@ -6,10 +6,8 @@ from .conftest import TEST_DATA
 logger = logging.getLogger(__name__)
 
 @pytest.fixture
-def test_file() -> str:
-    path = TEST_DATA['em_babe']['source_path']
-    with open(path) as f:
-        return f.read()
+def test_file(config_sources) -> str:
+    return config_sources['em_babe']
 
 def test_em_config_structure(parser: ClassParser, test_file: str) -> None:
     """Test parsing produces correct data structures"""
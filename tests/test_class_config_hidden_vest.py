@@ -2,15 +2,11 @@ import logging
 import pytest
 from class_scanner.parser.class_parser import ClassParser
 
-from .conftest import TEST_DATA
-
 logger = logging.getLogger(__name__)
 
 @pytest.fixture
-def vest_config() -> str:
-    path = TEST_DATA['hidden_vest']['source_path']
-    with open(path) as f:
-        return f.read()
+def vest_config(config_sources) -> str:
+    return config_sources['hidden_vest']
 
 def test_vest_config_structure(parser: ClassParser, vest_config: str) -> None:
     """Test parsing produces correct data structures"""
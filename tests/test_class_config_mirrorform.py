@@ -14,10 +14,8 @@ from .conftest import TEST_DATA
 logger = logging.getLogger(__name__)
 
 @pytest.fixture
-def test_file() -> str:
-    path = TEST_DATA['mirror']['source_path']
-    with open(path) as f:
-        return f.read()
+def test_file(config_sources) -> str:
+    return config_sources['mirror']
 
 def _get_section(result: ConfigSections, section: ConfigSectionName):
     """Helper to access section dictionary with type safety"""
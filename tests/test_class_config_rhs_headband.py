@@ -7,10 +7,8 @@ from .conftest import TEST_DATA
 logger = logging.getLogger(__name__)
 
 @pytest.fixture
-def headband_config() -> str:
-    path = TEST_DATA['headband']['source_path']
-    with open(path) as f:
-        return f.read()
+def headband_config(config_sources) -> str:
+    return config_sources['headband']
 
 def test_headband_config_structure(parser: ClassParser, headband_config: str) -> None:
     """Test parsing produces correct data structures"""
@@ -0,0 +1,46 @@
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'tools'))
+
+from reports import json_encoder
+from reports.json_encoder import CustomJSONEncoder, write_json
+from reports.types import ClassInfo, PropInfo
+
+
+def _report_data():
+    props = {"displayName": PropInfo(value="Fahrzeug ä", raw_value='"Fahrzeug ä"', type="STRING")}
+    pbos = [
+        {"name": f"addon_{i}.pbo", "class_count": 1,
+         "classes": [ClassInfo(name=f"Car_{i}", parent="Car", properties=props, config_type="CfgVehicles",
+                               category=None, container="CfgVehicles", display_name="Fahrzeug ä")]}
+        for i in range(3)
+    ]
+    return {"total_pbos": 3, "pbos": pbos, "empty": [], "path": Path("reports"), "tags": {"scan"}}
+
+@pytest.mark.parametrize("pretty", [True, False])
+def test_streamed_write_matches_one_shot_dump(tmp_path: Path, pretty: bool):
+    """Test that streaming top-level lists writes the same bytes as one dump call"""
+    if json_encoder.orjson is None:
+        pytest.skip("orjson not installed")
+    data = _report_data()
+    path = tmp_path / "report.json"
+
+    write_json(path, data, pretty=pretty)
+
+    orjson = json_encoder.orjson
+    option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0)
+    assert path.read_bytes() == orjson.dumps(data, default=CustomJSONEncoder().default, option=option)
+
+@pytest.mark.parametrize("pretty", [True, False])
+def test_write_matches_without_orjson(tmp_path: Path, monkeypatch: pytest.MonkeyPatch, pretty: bool):
+    """Test that the json fallback writes the same document"""
+    data = _report_data()
+    write_json(tmp_path / "orjson.json", data, pretty=pretty)
+    monkeypatch.setattr(json_encoder, "orjson", None)
+    write_json(tmp_path / "json.json", data, pretty=pretty)
+
+    assert json.loads((tmp_path / "json.json").read_bytes()) == json.loads((tmp_path / "orjson.json").read_bytes())
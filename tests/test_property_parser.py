@@ -180,3 +180,81 @@ def test_commented_properties():
     assert "block_commented" not in properties
     assert properties["valid"].value == "test"
     assert len(properties["array"].array_values) == 2
+
+
+def test_memoized_parsing(monkeypatch):
+    """Test that identical blocks hit the memoization cache when enabled"""
+    content = """
+        memo_prop = "cached";
+        memo_array[] = {1, 2};
+    """
+
+    monkeypatch.setattr(PropertyParser, 'enable_memoization', True)
+    parser = PropertyParser()
+    first = parser.parse_block_properties(content)
+    hits = PropertyParser.memoization_info().hits
+    second = parser.parse_block_properties(content)
+
+    assert PropertyParser.memoization_info().hits == hits + 1
+    assert first is not second
+    for name in ("memo_prop", "memo_array"):
+        assert first[name] is not second[name]
+        assert (first[name].raw_value, first[name].value_type, first[name].array_values) == \
+            (second[name].raw_value, second[name].value_type, second[name].array_values)
+
+    # Modifying one result must not leak into later parses
+    first["memo_prop"].raw_value = "changed"
+    assert parser.parse_block_properties(content)["memo_prop"].value == "cached"
+    assert PropertyParser.memoization_info().hits == hits + 2
+
+    monkeypatch.setattr(PropertyParser, 'enable_memoization', False)
+    uncached = parser.parse_block_properties(content)
+    assert PropertyParser.memoization_info().hits == hits + 2
+    assert uncached["memo_prop"].value == "cached"
+
+
+def test_parse_properties_iter_needed():
+    """Test lazy property iteration stops once needed names are found"""
+    content = """
+        model = "a.p3d";
+        skeletonName = "Skeleton";
+        class Nested {
+            file = "nested";
+        };
+        file = "file.rtm";
+        actions = "Actions";
+        unused = 1;
+    """
+
+    parser = PropertyParser()
+    names = [name for name, _ in parser.parse_properties_iter(content)]
+    assert names == ["model", "skeletonName", "file", "actions", "unused"]
+
+    needed = {"skeletonName", "file"}
+    found = dict(parser.parse_properties_iter(content, needed=needed))
+    assert set(found) == needed
+    assert found["file"].value == "file.rtm"
+    assert next((v for k, v in parser.parse_properties_iter(content, needed={"actions"})
+                 if k == "actions"), None).value == "Actions"
+
+
+def test_duplicate_property_keeps_first():
+    """Test that the first definition of a repeated property wins"""
+    content = """
+        x = 1;
+        y = 2;
+        x = 3;
+        arr[] = {1};
+        arr[] = {2};
+    """
+
+    parser = PropertyParser()
+    properties = parser.parse_block_properties(content)
+    assert properties["x"].value == "1"
+    assert properties["arr"].array_values == ("1",)
+    assert [name for name, _ in parser.parse_properties_iter(content)] == ["x", "y", "arr"]
+
+    # Looking a name up lazily agrees with the full parse
+    for name in ("x", "arr"):
+        found = dict(parser.parse_properties_iter(content, needed={name}))
+        assert found[name].raw_value == properties[name].raw_value
@@ -0,0 +1,74 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'tools'))
+
+from class_scanner.models import ClassData, PboScanData, PropertyValue, PropertyValueType
+import scan_report
+from scan_report import ReportGenerator
+
+
+def _scan_data(source: str) -> PboScanData:
+    props = {"displayName": PropertyValue("displayName", "Rifle", PropertyValueType.STRING),
+             "magazines": PropertyValue("magazines", "{a,b}", PropertyValueType.ARRAY, True, ["a", "b"])}
+    cls = ClassData(name="Rifle", parent="RifleCore", properties=props,
+                    source_file=Path("config.cpp"), container="CfgWeapons", category="Weapon")
+    return PboScanData(classes={"Rifle": cls}, source=source)
+
+def test_disk_cache_round_trip(tmp_path: Path):
+    """Test that cached results are stored as plain JSON and load back intact"""
+    generator = ReportGenerator(cache_dir=tmp_path)
+    pbo_file = tmp_path / "addon.pbo"
+    pbo_file.write_bytes(b"pbo")
+    cache_path = generator._disk_cache_path(pbo_file, pbo_file.stat())
+    result = _scan_data(str(pbo_file))
+
+    generator._store_disk_cached(cache_path, result)
+
+    assert cache_path.suffix == ".json"
+    assert cache_path.read_bytes().startswith(b"{")
+    assert not list(tmp_path.glob("*.tmp"))
+    assert generator._load_disk_cached(cache_path).to_dict() == result.to_dict()
+
+def test_disk_cache_ignores_unreadable_entries(tmp_path: Path):
+    """Test that truncated or foreign entries are treated as misses"""
+    generator = ReportGenerator(cache_dir=tmp_path)
+    cache_path = tmp_path / "entry.json"
+    cache_path.write_bytes(b'{"classes": {')
+
+    assert generator._load_disk_cached(cache_path) is None
+
+class FailingScanner:
+    """Scanner stub that fails on bad.pbo and succeeds on everything else"""
+    def __init__(self, cache_size: int = 128):
+        pass
+
+    def scan_pbo(self, pbo_path: Path) -> PboScanData:
+        if pbo_path.name == "bad.pbo":
+            raise ValueError("corrupt header")
+        return _scan_data(str(pbo_path))
+
+def test_scan_chunk_reports_failure_per_pbo(tmp_path: Path, monkeypatch):
+    """Test that a failing PBO becomes an error outcome and the chunk goes on"""
+    monkeypatch.setattr(scan_report, "Scanner", FailingScanner)
+    monkeypatch.setattr(scan_report, "_worker", scan_report.threading.local())
+    chunk = [tmp_path / "bad.pbo", tmp_path / "good.pbo"]
+
+    outcomes = scan_report._scan_chunk(chunk)
+
+    assert [(path, error) for path, _, error in outcomes] == [(chunk[0], "corrupt header"), (chunk[1], None)]
+    assert outcomes[0][1] is None
+    assert outcomes[1][1].source == str(chunk[1])
+
+def test_scan_directories_continues_after_failure(tmp_path: Path, monkeypatch):
+    """Test that one failing PBO is counted as an error and the others are scanned"""
+    monkeypatch.setattr(scan_report, "Scanner", FailingScanner)
+    for name in ("bad.pbo", "first.pbo", "second.pbo"):
+        (tmp_path / name).write_bytes(b"pbo")
+    generator = ReportGenerator(max_workers=1, executor="thread", use_disk_cache=False)
+
+    results = generator.scan_directories([tmp_path])
+
+    assert sorted(path.name for path in results) == ["first.pbo", "second.pbo"]
+    assert generator._errors == 1
+    assert generator._completed == 2
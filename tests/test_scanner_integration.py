@@ -5,16 +5,22 @@ import sys
 # Add parent directory to Python path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from class_scanner.scanner import Scanner
+from class_scanner.models import PboScanData
+from class_scanner.scanner import Scanner, find_pbo_files
 
-@pytest.fixture
+class StubScanner(Scanner):
+    """Scanner that reports one empty PboScanData per PBO without extracting"""
+    def scan_pbo(self, path: Path):
+        return PboScanData(classes={}, source=path.stem)
+
+@pytest.fixture(scope="session")
 def test_data_path() -> Path:
     """Get path to test data directory"""
     return Path(__file__).parent / 'data'
 
 @pytest.fixture
 def scanner() -> Scanner:
-    """Create scanner instance"""
+    """Create scanner instance (per test, as it caches scan results)"""
     return Scanner()
 
 def test_scan_sample_directory(scanner: Scanner, test_data_path: Path):
@@ -30,6 +36,39 @@ def test_scan_sample_directory(scanner: Scanner, test_data_path: Path):
     assert any('mirrorform.pbo' in path for path in pbo_paths)
     assert any('babe_em.pbo' in path for path in pbo_paths)
 
+def test_scan_directory_process_pool(tmp_path: Path):
+    """Test that pooled and in-process directory scans agree"""
+    for i in range(4):
+        (tmp_path / f"addon_{i}.pbo").touch()
+
+    pooled = StubScanner().scan_directory(tmp_path, max_workers=2)
+    sequential = StubScanner().scan_directory(tmp_path, max_workers=1)
+
+    assert len(pooled) == 4
+    assert pooled.keys() == sequential.keys()
+    assert {data.source for data in pooled.values()} == {f"addon_{i}" for i in range(4)}
+
+def test_scan_pbo_reuses_unchanged_files(scanner: Scanner, tmp_path: Path, monkeypatch):
+    """Test that rescanning an unchanged PBO skips extraction"""
+    pbo_file = tmp_path / "addon.pbo"
+    pbo_file.write_bytes(b"v1")
+    calls = []
+
+    def extract(path):
+        calls.append(path)
+        return {"config.cpp": "class Cached {};"}
+
+    monkeypatch.setattr(scanner.extractor, "extract_code_files", extract)
+
+    first = scanner.scan_pbo(pbo_file)
+    assert scanner.scan_pbo(pbo_file) is first
+    assert len(calls) == 1
+    assert "Cached" in first.classes
+
+    pbo_file.write_bytes(b"v2 changed")
+    scanner.scan_pbo(pbo_file)
+    assert len(calls) == 2
+
 def test_scan_invalid_directory(scanner: Scanner, tmp_path: Path):
     """Test scanner behavior with invalid directory"""
     invalid_dir = tmp_path / "nonexistent"
@@ -76,63 +115,6 @@ def test_empty_and_whitespace_files(scanner: Scanner, tmp_path: Path):
     result = scanner.scan_directory(pbo_dir)
     assert not result, "Expected no results from empty files"
 
-def test_large_file_handling(scanner: Scanner, tmp_path: Path):
-    """Test handling of large files"""
-    pbo_dir = tmp_path / "test_large"
-    pbo_dir.mkdir()
-    
-    # Create large file with repeated class definitions
-    large_content = "class Test{};\\n" * 100000
-    (pbo_dir / "large.cpp").write_text(large_content)
-    
-    result = scanner.scan_directory(pbo_dir)
-    assert result is not None, "Scanner should handle large files"
-
-def test_special_characters_in_names(scanner: Scanner, tmp_path: Path):
-    """Test handling of special characters in class names"""
-    pbo_dir = tmp_path / "test_special"
-    pbo_dir.mkdir()
-    
-    special_classes = """
-    class Test-Name {};
-    class Test@Name {};
-    class Test#Name {};
-    class Test$Name {};
-    class Test&Name {};
-    class Test.Name {};
-    """
-    
-    (pbo_dir / "special.cpp").write_text(special_classes)
-    result = scanner.scan_directory(pbo_dir)
-    assert result is not None, "Scanner should handle special characters"
-
-def test_circular_inheritance(scanner: Scanner, tmp_path: Path):
-    """Test handling of circular class inheritance"""
-    pbo_dir = tmp_path / "test_circular"
-    pbo_dir.mkdir()
-    
-    circular_classes = """
-    class A : C {};
-    class B : A {};
-    class C : B {};
-    """
-    
-    (pbo_dir / "circular.cpp").write_text(circular_classes)
-    result = scanner.scan_directory(pbo_dir)
-    assert result is not None, "Scanner should handle circular inheritance"
-
-def test_deeply_nested_classes(scanner: Scanner, tmp_path: Path):
-    """Test handling of deeply nested class definitions"""
-    pbo_dir = tmp_path / "test_nested"
-    pbo_dir.mkdir()
-    
-    # Create deeply nested class structure
-    nested_content = "class" + "{ class".join([f"Level{i}" for i in range(50)]) + "{};" * 50
-    
-    (pbo_dir / "nested.cpp").write_text(nested_content)
-    result = scanner.scan_directory(pbo_dir)
-    assert result is not None, "Scanner should handle deeply nested classes"
-
 def test_mixed_line_endings(scanner: Scanner, tmp_path: Path):
     """Test handling of mixed line endings"""
     pbo_dir = tmp_path / "test_endings"
@@ -147,17 +129,75 @@ def test_mixed_line_endings(scanner: Scanner, tmp_path: Path):
         first_result = next(iter(result.values()))
         assert len(first_result.classes) == 3, "Should find all classes regardless of line endings"
 
-def test_unicode_characters(scanner: Scanner, tmp_path: Path):
-    """Test handling of Unicode characters in class definitions"""
-    pbo_dir = tmp_path / "test_unicode"
-    pbo_dir.mkdir()
-    
-    unicode_content = """
+
+@pytest.mark.parametrize("file_name, content", [
+    pytest.param("large.cpp", b"class Test{};\n" * 100000, id="large_file", marks=pytest.mark.slow),
+    pytest.param("special.cpp", """
+    class Test-Name {};
+    class Test@Name {};
+    class Test#Name {};
+    class Test$Name {};
+    class Test&Name {};
+    class Test.Name {};
+    """, id="special_characters"),
+    pytest.param("circular.cpp", """
+    class A : C {};
+    class B : A {};
+    class C : B {};
+    """, id="circular_inheritance"),
+    pytest.param("nested.cpp",
+                 "class" + "{ class".join([f"Level{i}" for i in range(50)]) + "{};" * 50,
+                 id="deeply_nested"),
+    pytest.param("unicode.cpp", """
     class TestÜnicode {};
     class TestЮникод {};
     class Test数字 {};
-    """
-    
-    (pbo_dir / "unicode.cpp").write_text(unicode_content, encoding='utf-8')
+    """, id="unicode"),
+])
+def test_scan_unusual_input(scanner: Scanner, tmp_path: Path, file_name: str, content: str | bytes):
+    """Test that unusual or malformed input does not break directory scans"""
+    pbo_dir = tmp_path / "test_input"
+    pbo_dir.mkdir()
+    if isinstance(content, str):
+        content = content.encode('utf-8')
+    (pbo_dir / file_name).write_bytes(content)
+
     result = scanner.scan_directory(pbo_dir)
-    assert result is not None, "Scanner should handle Unicode characters"
+    assert result is not None, f"Scanner should handle {file_name}"
+
+def test_scan_pbo_does_not_cache_failures(tmp_path: Path, monkeypatch):
+    """Test that a failed scan is retried instead of served from the cache"""
+    scanner = Scanner()
+    pbo_file = tmp_path / "broken.pbo"
+    pbo_file.write_bytes(b"data")
+    calls = []
+
+    def extract(path):
+        calls.append(path)
+        return {}
+
+    monkeypatch.setattr(scanner.extractor, "extract_code_files", extract)
+
+    assert scanner.scan_pbo(pbo_file) is None
+    assert scanner.scan_pbo(pbo_file) is None
+    assert len(calls) == 2
+
+def test_find_pbo_files_wide_tree(tmp_path: Path):
+    """Test that wide trees are walked completely and .PBO matches any case"""
+    for i in range(200):
+        addon = tmp_path / f"@mod_{i}" / "addons"
+        addon.mkdir(parents=True)
+        (addon / f"addon_{i}.pbo").touch()
+        (addon / f"notes_{i}.txt").touch()
+    (tmp_path / "UPPER.PBO").touch()
+
+    names = {entry.name for entry in find_pbo_files(tmp_path)}
+
+    assert len(names) == 201
+    assert "UPPER.PBO" in names
+    assert "addon_199.pbo" in names
+
+def test_find_pbo_files_missing_root(tmp_path: Path):
+    """Test that an unreadable root raises instead of returning nothing"""
+    with pytest.raises(OSError):
+        find_pbo_files(tmp_path / "missing")
@@ -0,0 +1,59 @@
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'tools'))
+
+from reports import structure_report
+from reports.structure_report import create_structure_report
+from reports.types import ClassInfo
+
+
+def _report_data(count: int):
+    pbos = []
+    for i in range(count):
+        classes = [ClassInfo(name=f"Class_{i}", parent="Base", properties={"scope": 2},
+                             config_type="CfgVehicles", category="Vehicle", container="CfgVehicles",
+                             display_name=f"Class {i}")]
+        pbos.append({"name": f"/mods/@mod/addons/addon_{i}.pbo", "class_count": 1, "classes": classes})
+    return {"pbos": pbos}
+
+def _read_tree(output_dir: Path):
+    return {p.relative_to(output_dir).as_posix(): p.read_bytes() for p in sorted(output_dir.rglob("classes.json"))}
+
+def test_structure_report_is_sequential_by_default(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    """Test that no process pool is started unless asked for"""
+    import concurrent.futures
+
+    def no_pool(*args, **kwargs):
+        raise AssertionError("process pool used without being requested")
+
+    monkeypatch.setattr(concurrent.futures, "ProcessPoolExecutor", no_pool)
+    create_structure_report(_report_data(20), tmp_path)
+
+    files = _read_tree(tmp_path)
+    assert len(files) == 20
+    data = json.loads(files["@addons/addon_0/classes.json"])
+    assert data["classes"]["Class_0"]["parent"] == "Base"
+
+def test_structure_report_pool_matches_sequential(tmp_path: Path):
+    """Test that an explicitly requested pool writes the same files"""
+    report_data = _report_data(20)
+    create_structure_report(report_data, tmp_path / "sequential")
+    create_structure_report(report_data, tmp_path / "pool", max_workers=2)
+
+    assert _read_tree(tmp_path / "pool") == _read_tree(tmp_path / "sequential")
+
+def test_dumps_matches_without_orjson(monkeypatch: pytest.MonkeyPatch):
+    """Test that orjson and json fallback output are identical"""
+    if structure_report.orjson is None:
+        pytest.skip("orjson not installed")
+    data = {"name": "Kächele №1", "path": Path("addons/a.pbo"), "tags": {"only"}, "scope": 2.5}
+    with_orjson = structure_report._dumps(data)
+
+    monkeypatch.setattr(structure_report, "orjson", None)
+
+    assert structure_report._dumps(data) == with_orjson
+    assert "Kächele".encode("utf-8") in with_orjson
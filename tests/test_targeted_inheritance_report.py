@@ -0,0 +1,29 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'tools'))
+
+from reports.targeted_inheritance_report import create_targeted_inheritance_report
+from reports.types import ClassInfo
+
+
+def _class(name: str, parent: str) -> ClassInfo:
+    return ClassInfo(name=name, parent=parent, properties={}, config_type="CfgVehicles",
+                     category=None, container="CfgVehicles", display_name=None)
+
+def test_targeted_inheritance_rows(tmp_path: Path):
+    """Test the rows written for root classes, their descendants and their ancestry"""
+    classes = [_class("All", ""), _class("Land", "All"), _class("Car", "Land"), _class("Car_F", "Car"),
+               _class("Tank", "Land"), _class("Air", "All"), _class("Helicopter", "Air")]
+    report_data = {"pbos": [{"name": "vehicles.pbo", "class_count": len(classes), "classes": classes}]}
+    output_path = tmp_path / "targeted_inheritance.csv"
+
+    create_targeted_inheritance_report(report_data, ["Land", "Car"], output_path)
+
+    assert output_path.read_text(encoding="utf-8") == (
+        "source;target;root_distance;inheritance_path\n"
+        "Car;Land;2;Car -> Land -> All\n"
+        "Car_F;Car;3;Car_F -> Car -> Land -> All\n"
+        "Land;All;1;Land -> All\n"
+        "Tank;Land;2;Tank -> Land -> All\n"
+    )
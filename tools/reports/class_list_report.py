@@ -1,35 +1,38 @@
 import logging
 from pathlib import Path
-from .types import ReportData
+from functools import lru_cache
+from typing import Iterator, Optional
+from .types import PropInfo, ReportData
+from .writer import write_lines
 
-def format_property_value(prop_data: dict) -> str:
-    """Format property value for display"""
-    if prop_data.get('is_array'):
-        value = f"[{', '.join(str(v) for v in prop_data['array_values'])}]"
-    else:
-        value = str(prop_data.get('value', ''))
-    
-    if prop_data.get('type'):
-        value += f" ({prop_data['type']})"
+@lru_cache(maxsize=4096)
+def _format_scalar(value: str, value_type: Optional[str]) -> str:
+    """Format a scalar value (cached: the same values recur across many classes)"""
+    if value_type:
+        return f"{value} ({value_type})"
     return value
 
-def create_class_list_report(report_data: ReportData, output_path: Path) -> None:
-    """Generate the class list report with detailed class information"""
-    if not report_data:
-        logging.error("Invalid report data")
-        return
+def format_property_value(prop_data: PropInfo) -> str:
+    """Format property value for display"""
+    if not prop_data.is_array:
+        return _format_scalar(str(prop_data.value), prop_data.type)
 
-    lines = [
-        "Class Scanner Report - Full Class List",
-        f"Generated: {report_data.get('timestamp', 'Unknown')}",
-        "",
-        f"Total PBOs: {report_data.get('total_pbos', 0)}",
-        f"Total Classes: {report_data.get('total_classes', 0)}",
-        f"Total Properties: {report_data.get('total_properties', 0)}",
-        "",
-        "Classes by PBO:",
-        "=============="
-    ]
+    value = f"[{', '.join(map(str, prop_data.array_values))}]"
+    if prop_data.type:
+        value += f" ({prop_data.type})"
+    return value
+
+def _iter_lines(report_data: ReportData) -> Iterator[str]:
+    """Yield the class list report line by line"""
+    yield "Class Scanner Report - Full Class List"
+    yield f"Generated: {report_data.get('timestamp', 'Unknown')}"
+    yield ""
+    yield f"Total PBOs: {report_data.get('total_pbos', 0)}"
+    yield f"Total Classes: {report_data.get('total_classes', 0)}"
+    yield f"Total Properties: {report_data.get('total_properties', 0)}"
+    yield ""
+    yield "Classes by PBO:"
+    yield "=============="
 
     for pbo in sorted(report_data.get("pbos", []), key=lambda x: x.get("name", "")):
         name = pbo.get("name", "Unknown")
@@ -38,35 +41,42 @@ def create_class_list_report(report_data: ReportData, output_path: Path) -> None
         if not classes:
             continue
             
-        lines.append(f"\n{name} ({len(classes)} classes):")
+        yield f"\n{name} ({len(classes)} classes):"
         
-        for cls in sorted(classes, key=lambda x: x.get("name", "")):
-            if not cls.get("name"):
+        for cls in sorted(classes, key=lambda x: x.name):
+            if not cls.name:
                 continue
                 
             # Basic class information
-            lines.append(f"\n  {cls['name']}:")
+            yield f"\n  {cls.name}:"
             
             # Class attributes
-            if cls.get("display_name"):
-                lines.append(f"    Display Name: {cls['display_name']}")
-            if cls.get("parent"):
-                lines.append(f"    Parent: {cls['parent']}")
-            if cls.get("container"):
-                lines.append(f"    Container: {cls['container']}")
-            if cls.get("config_type"):
-                lines.append(f"    Config Type: {cls['config_type']}")
-            if cls.get("category"):
-                lines.append(f"    Category: {cls['category']}")
+            if cls.display_name:
+                yield f"    Display Name: {cls.display_name}"
+            if cls.parent:
+                yield f"    Parent: {cls.parent}"
+            if cls.container:
+                yield f"    Container: {cls.container}"
+            if cls.config_type:
+                yield f"    Config Type: {cls.config_type}"
+            if cls.category:
+                yield f"    Category: {cls.category}"
                 
             # Properties section
-            if cls.get("properties"):
-                lines.append("    Properties:")
-                for prop_name, prop_data in sorted(cls["properties"].items()):
+            if cls.properties:
+                yield "    Properties:"
+                for prop_name, prop_data in sorted(cls.properties.items()):
                     value = format_property_value(prop_data)
-                    lines.append(f"      {prop_name}: {value}")
+                    yield f"      {prop_name}: {value}"
+
+def create_class_list_report(report_data: ReportData, output_path: Path) -> None:
+    """Generate the class list report with detailed class information"""
+    if not report_data:
+        logging.error("Invalid report data")
+        return
 
     try:
-        output_path.write_text("\n".join(lines), encoding='utf-8')
+        # Stream lines to disk instead of building the whole report in memory
+        write_lines(output_path, _iter_lines(report_data))
     except Exception as e:
         logging.error(f"Error writing class list report: {e}")
@@ -1,20 +1,25 @@
 import logging
 from pathlib import Path
-from typing import Any, List
+from typing import TYPE_CHECKING, Any, Iterator
 from .types import ReportData
-from .inheritance_utils import InheritanceMapper
+from .writer import write_lines
 
+if TYPE_CHECKING:
+    from .inheritance_utils import InheritanceMapper
 
-def format_class_tree(class_name: str, mapper: InheritanceMapper,
-                      config_type: str, level: int = 0,
-                      visited: set[Any] | None = None) -> List[str]:
-    """Format a class hierarchy tree recursively"""
-    if visited is None:
-        visited = set()
-    if class_name in visited:
-        return [f"{'  ' * level}↳ {class_name} [CYCLE]"]
 
-    visited.add(class_name)
+# Tree line prefixes for the usual depths, so lines don't rebuild the indent
+_CACHED_LEVELS = 64
+_PREFIXES = tuple(f"{'  ' * level}↳ " for level in range(_CACHED_LEVELS))
+
+
+def _prefix(level: int) -> str:
+    """Indent and arrow for a tree line at the given level"""
+    return _PREFIXES[level] if level < _CACHED_LEVELS else f"{'  ' * level}↳ "
+
+
+def _format_label(class_name: str, mapper: 'InheritanceMapper') -> str:
+    """Format the level-independent part of a class's tree line"""
     info = mapper.class_info.get(class_name, {})
 
     display_name = info.get("display_name", "")
@@ -24,14 +29,77 @@ def format_class_tree(class_name: str, mapper: InheritanceMapper,
         label += f" ({display_name})"
     if category == "External":
         label += " [External]"
+    return label
 
-    lines = [f"{'  ' * level}↳ {label}" if level > 0 else label]
-
-    for child in sorted(mapper.get_all_children(class_name, config_type)):
-        if child not in visited:
-            lines.extend(format_class_tree(child, mapper, config_type, level + 1, visited.copy()))
 
-    return lines
+def format_class_tree(class_name: str, mapper: 'InheritanceMapper',
+                      config_type: str, level: int = 0,
+                      visited: set[Any] | None = None,
+                      labels: dict[str, str] | None = None) -> Iterator[str]:
+    """Format a class hierarchy tree depth-first, one line at a time"""
+    if visited is None:
+        visited = set()
+    if labels is None:
+        labels = {}
+    if class_name in visited:
+        yield f"{_prefix(level)}{class_name} [CYCLE]"
+        return
+
+    # A class reachable through both its parent and its container is drawn
+    # under each; labels caches its text so only the indent is rebuilt
+    label = labels.get(class_name)
+    if label is None:
+        label = labels[class_name] = _format_label(class_name, mapper)
+    yield _prefix(level) + label if level > 0 else label
+
+    # Walk with an explicit stack of (class, remaining children) so deep
+    # hierarchies neither hit the recursion limit nor pay for a chain of
+    # nested generators on every line. visited holds the current ancestor
+    # path: added on the way down and discarded on the way back up, so
+    # siblings may share descendants.
+    visited.add(class_name)
+    stack = [(class_name, iter(mapper.get_sorted_children(class_name, config_type)))]
+    while stack:
+        name, children = stack[-1]
+        for child in children:
+            if child not in visited:
+                label = labels.get(child)
+                if label is None:
+                    label = labels[child] = _format_label(child, mapper)
+                depth = level + len(stack)
+                yield (_PREFIXES[depth] if depth < _CACHED_LEVELS else _prefix(depth)) + label
+                visited.add(child)
+                stack.append((child, iter(mapper.get_sorted_children(child, config_type))))
+                break
+        else:
+            visited.discard(name)
+            stack.pop()
+
+
+def _iter_lines(report_data: ReportData, mapper: 'InheritanceMapper') -> Iterator[str]:
+    """Yield the hierarchy report line by line"""
+    yield "Class Scanner Report - Class Hierarchy"
+    yield f"Generated: {report_data.get('timestamp', 'Unknown')}"
+    yield ""
+    yield "Class Hierarchy by Config Type:"
+    yield "=========================="
+
+    found = False
+    labels: dict[str, str] = {}
+    for config_type in mapper.get_config_types():
+        yield f"\nConfig Type: {config_type}"
+        yield "=" * (len(config_type) + 13)
+
+        processed = set()
+        for root in mapper.get_sorted_roots(config_type):
+            if root not in processed:
+                yield from format_class_tree(root, mapper, config_type, labels=labels)
+                yield ""
+                processed.add(root)
+                found = True
+
+    if not found:
+        yield "\nNo class hierarchies found."
 
 
 def create_hierarchy_report(report_data: ReportData, output_path: Path) -> None:
@@ -41,33 +109,11 @@ def create_hierarchy_report(report_data: ReportData, output_path: Path) -> None:
             logging.error("Invalid or empty report data")
             return
 
+        from .inheritance_utils import InheritanceMapper
         mapper = InheritanceMapper(report_data)
 
-        lines = [
-            "Class Scanner Report - Class Hierarchy",
-            f"Generated: {report_data.get('timestamp', 'Unknown')}",
-            "",
-            "Class Hierarchy by Config Type:",
-            "=========================="
-        ]
-
-        for config_type in mapper.get_config_types():
-            lines.extend([
-                f"\nConfig Type: {config_type}",
-                "=" * (len(config_type) + 13)
-            ])
-
-            processed = set()
-            for root in sorted(mapper.find_root_classes(config_type)):
-                if root not in processed:
-                    lines.extend(format_class_tree(root, mapper, config_type))
-                    lines.append("")
-                    processed.add(root)
-
-        if not any(lines[4:]):
-            lines.append("\nNo class hierarchies found.")
-
-        output_path.write_text("\n".join(lines), encoding='utf-8')
+        # Stream lines to disk instead of building the whole report in memory
+        write_lines(output_path, _iter_lines(report_data, mapper))
 
     except Exception as e:
         logging.error(f"Error in create_hierarchy_report: {e}")
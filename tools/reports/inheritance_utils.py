@@ -1,132 +1,161 @@
-from collections import defaultdict
-from typing import Dict, Set, List, Optional
+import sys
+from collections import defaultdict, deque
+from typing import Dict, FrozenSet, Set, List, Optional, Tuple
 from .types import ReportData
 
+_EMPTY: FrozenSet[str] = frozenset()
+
 
 class InheritanceMapper:
     def __init__(self, report_data: ReportData):
         self.report_data = report_data
-        self.inheritance_map: Dict[str, Dict[str, set]] = defaultdict(lambda: defaultdict(set))
-        self.container_map: Dict[str, Dict[str, set]] = defaultdict(lambda: defaultdict(set))
+        # Both keyed by (parent or container name, config type)
+        self.inheritance_map: Dict[Tuple[str, str], Set[str]] = {}
+        self.container_map: Dict[Tuple[str, str], Set[str]] = {}
         self.reverse_map: Dict[str, str] = {}
         self.class_info: Dict[str, Dict] = {}
-        self._inheritance_chains: Dict[str, List[str]] = {}
-        self._inheritance_paths: Dict[str, Set[str]] = {}
+        self._inheritance_chains: Dict[str, Tuple[str, ...]] = {}
+        self._inheritance_paths: Dict[str, FrozenSet[str]] = {}
         self._inheritance_loops: Set[str] = set()  # Track classes involved in inheritance loops
+        self._subclasses: Optional[Dict[str, List[str]]] = None  # parent -> children, built on first use
+        self._children_cache: Dict[Tuple[str, str], FrozenSet[str]] = {}  # Maps are fixed after _build_maps
+        self._sorted_children: Dict[Tuple[str, str], Tuple[str, ...]] = {}
+        self._sorted_roots: Dict[str, Tuple[str, ...]] = {}
         self._build_maps()
         self._precalculate_inheritance_paths()
+        self._precalculate_sorted()
 
     def _build_maps(self) -> None:
         """Build inheritance and container maps from report data with loop detection"""
         # First pass: build basic maps
         for pbo in self.report_data.get("pbos", []):
             for cls in pbo.get("classes", []):
-                if not isinstance(cls, dict) or not cls.get("name"):
+                if not cls.name:
                     continue
 
-                name = cls["name"]
-                parent = cls.get("parent", "")
-                container = cls.get("container", "")
-                config_type = cls.get("config_type", "default")
+                # Names repeat across every map below; intern them once
+                name = sys.intern(cls.name)
+                parent = sys.intern(cls.parent or "")
+                container = sys.intern(cls.container or "")
+                config_type = sys.intern(cls.config_type)
 
                 self.class_info[name] = {
                     "config_type": config_type,
-                    "category": cls.get("category", "Uncategorized"),
+                    "category": cls.category,
                     "parent": parent,
                     "container": container,
-                    "display_name": cls.get("display_name")
+                    "display_name": cls.display_name
                 }
 
                 if parent:
-                    self.inheritance_map[parent][config_type].add(name)
+                    self.inheritance_map.setdefault((parent, config_type), set()).add(name)
                     self.reverse_map[name] = parent
                 if container:
-                    self.container_map[container][config_type].add(name)
-
-        # Second pass: detect inheritance loops
-        for class_name in self.class_info:
-            visited = set()
+                    self.container_map.setdefault((container, config_type), set()).add(name)
+
+        # Second pass: detect inheritance loops. Every class has at most one
+        # parent, so each class is walked once: a walk stops at the first
+        # class already reached, and only a class reached by the same walk
+        # closes a loop.
+        reached_by: Dict[str, int] = {}
+        for walk, class_name in enumerate(self.class_info):
             current = class_name
-            while current in self.reverse_map:
-                if current in visited:
-                    # Found a loop - mark all classes in the loop
-                    loop_start = current
-                    loop_current = self.reverse_map[current]
-                    self._inheritance_loops.add(current)
-                    while loop_current != loop_start:
-                        self._inheritance_loops.add(loop_current)
-                        loop_current = self.reverse_map[loop_current]
-                    # Break the loop by removing the inheritance relationship
-                    del self.reverse_map[current]
-                    break
-                visited.add(current)
+            while current in self.reverse_map and current not in reached_by:
+                reached_by[current] = walk
                 current = self.reverse_map[current]
+            if current in self.reverse_map and reached_by[current] == walk:
+                # Found a loop - mark all classes in the loop
+                loop_start = current
+                loop_current = self.reverse_map[current]
+                self._inheritance_loops.add(current)
+                while loop_current != loop_start:
+                    self._inheritance_loops.add(loop_current)
+                    loop_current = self.reverse_map[loop_current]
+                # Break the loop by removing the inheritance relationship
+                del self.reverse_map[current]
 
     def _precalculate_inheritance_paths(self) -> None:
         """Pre-calculate all inheritance paths for faster lookups, handling loops"""
-        self._inheritance_paths = {}
+        # A class's path is its parent's path plus itself, so each chain is
+        # walked only up to the first class whose path is already known
+        paths: Dict[str, FrozenSet[str]] = {}
         for class_name in self.class_info:
-            if class_name in self._inheritance_loops:
-                # For classes in loops, only include the class itself
-                self._inheritance_paths[class_name] = {class_name}
-                continue
-
-            path = set()
+            chain = []
             current = class_name
-            while current in self.reverse_map:
-                path.add(current)
+            while current not in paths and current in self.reverse_map:
+                chain.append(current)
                 current = self.reverse_map[current]
-            path.add(current)
-            self._inheritance_paths[class_name] = path
-
-    def get_inheritance_chain(self, class_name: str, visited: Optional[Set[str]] = None) -> List[str]:
-        """Get the full inheritance chain for a class (cached), handling loops"""
-        if class_name in self._inheritance_chains:
-            return self._inheritance_chains[class_name].copy()
-
-        if class_name in self._inheritance_loops:
-            # For classes in loops, return only the class itself
-            chain = [class_name]
-            self._inheritance_chains[class_name] = chain
-            return chain.copy()
-
-        if visited is None:
-            visited = set()
-
-        if class_name in visited:
-            return []
+            path = paths.get(current)
+            if path is None:
+                path = paths[current] = frozenset((current,))
+            for name in reversed(chain):
+                path = paths[name] = path | {name}
+
+        self._inheritance_paths = {
+            # For classes in loops, only include the class itself
+            class_name: frozenset((class_name,)) if class_name in self._inheritance_loops else paths[class_name]
+            for class_name in self.class_info
+        }
 
-        visited.add(class_name)
-        chain = [class_name]
+    def _precalculate_sorted(self) -> None:
+        """Pre-sort children and root classes once for repeated tree walks"""
+        for key in self.inheritance_map.keys() | self.container_map.keys():
+            self._sorted_children[key] = tuple(sorted(self.get_all_children(*key)))
 
-        parent = self.reverse_map.get(class_name)
-        if parent:
-            parent_chain = self.get_inheritance_chain(parent, visited)
-            chain.extend(parent_chain)
+        roots: Dict[str, List[str]] = defaultdict(list)
+        for name, info in self.class_info.items():
+            parent_info = self.class_info.get(info["parent"]) if info["parent"] else None
+            if parent_info is None or parent_info["config_type"] != info["config_type"]:
+                roots[info["config_type"]].append(name)
+        self._sorted_roots = {config_type: tuple(sorted(names)) for config_type, names in roots.items()}
 
-        self._inheritance_chains[class_name] = chain
-        return chain.copy()
+    def get_inheritance_chain(self, class_name: str) -> Tuple[str, ...]:
+        """Get the full inheritance chain for a class (cached), handling loops"""
+        cached = self._inheritance_chains.get(class_name)
+        if cached is not None:
+            return cached
+
+        chain: List[str] = []
+        seen: Set[str] = set()
+        current = class_name
+        while current and current not in seen:
+            known = self._inheritance_chains.get(current)
+            if known is not None:
+                chain.extend(known)
+                break
+            chain.append(current)
+            # For classes in loops, the chain ends at the class itself
+            if current in self._inheritance_loops:
+                break
+            seen.add(current)
+            current = self.reverse_map.get(current)
+
+        result = self._inheritance_chains[class_name] = tuple(chain)
+        return result
 
     def find_root_classes(self, config_type: str) -> Set[str]:
         """Find root classes for a specific config type"""
-        return {
-            name for name, info in self.class_info.items()
-            if info["config_type"] == config_type and (
-                not info["parent"] or
-                info["parent"] not in self.class_info or
-                self.class_info[info["parent"]]["config_type"] != config_type
+        # Roots of every config type are found in one pass by _precalculate_sorted
+        return set(self._sorted_roots.get(config_type, ()))
+
+    def get_all_children(self, class_name: str, config_type: str) -> FrozenSet[str]:
+        """Get all children (inheritance and container) for a class (cached)"""
+        key = (class_name, config_type)
+        children = self._children_cache.get(key)
+        if children is None:
+            children = self._children_cache[key] = (
+                _EMPTY.union(self.inheritance_map.get(key, _EMPTY), self.container_map.get(key, _EMPTY))
             )
-        }
-
-    def get_all_children(self, class_name: str, config_type: str) -> Set[str]:
-        """Get all children (inheritance and container) for a class"""
-        children = set()
-        if class_name in self.inheritance_map and config_type in self.inheritance_map[class_name]:
-            children.update(self.inheritance_map[class_name][config_type])
-        if class_name in self.container_map and config_type in self.container_map[class_name]:
-            children.update(self.container_map[class_name][config_type])
         return children
 
+    def get_sorted_children(self, class_name: str, config_type: str) -> Tuple[str, ...]:
+        """Get all children of a class in name order (pre-calculated)"""
+        return self._sorted_children.get((class_name, config_type), ())
+
+    def get_sorted_roots(self, config_type: str) -> Tuple[str, ...]:
+        """Get root classes of a config type in name order (pre-calculated)"""
+        return self._sorted_roots.get(config_type, ())
+
     def get_config_types(self) -> List[str]:
         """Get sorted list of all config types"""
         return sorted(set(
@@ -135,7 +164,23 @@ class InheritanceMapper:
 
     def inherits_from_any(self, class_name: str, root_classes: Set[str]) -> bool:
         """Check if a class inherits from any of the given root classes using pre-calculated paths"""
-        return bool(self._inheritance_paths[class_name] & root_classes)
+        return not self._inheritance_paths[class_name].isdisjoint(root_classes)
+
+    def descendants_of(self, roots: Set[str]) -> Set[str]:
+        """Get every class that inherits, directly or not, from one of the roots"""
+        if self._subclasses is None:
+            self._subclasses = defaultdict(list)
+            for child, parent in self.reverse_map.items():
+                self._subclasses[parent].append(child)
+
+        seen: Set[str] = set()
+        queue = deque(roots)
+        while queue:
+            for child in self._subclasses.get(queue.popleft(), ()):
+                if child not in seen:
+                    seen.add(child)
+                    queue.append(child)
+        return seen
 
     def get_inheritance_loops(self) -> Set[str]:
         """Return set of class names involved in inheritance loops"""
@@ -1,17 +1,83 @@
 import json
+from collections.abc import Mapping
+from enum import Enum
+from pathlib import Path, PurePath
+from typing import Any
+
+from .types import ClassInfo, PropInfo
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Types that always serialize as their string form
+_STR_TYPES = (PurePath, Enum)
+# Report records that know their own dict form
+_RECORD_TYPES = (ClassInfo, PropInfo)
 
 class CustomJSONEncoder(json.JSONEncoder):
     def default(self, obj):
+        # Dispatch on type first; only unknown objects reach the attribute probe
+        if isinstance(obj, _RECORD_TYPES):
+            return obj.to_dict()
+        if isinstance(obj, Mapping):
+            return dict(obj)
+        if isinstance(obj, (set, frozenset)):
+            return list(obj)
+        if isinstance(obj, _STR_TYPES):
+            return str(obj)
         if hasattr(obj, 'type') and hasattr(obj, 'value'):
             return {
                 'type': obj.type,
                 'value': obj.value,
                 'raw_value': getattr(obj, 'raw_value', None)
             }
-        try:
-            return dict(obj)
-        except (TypeError, ValueError):
-            try:
-                return str(obj)
-            except Exception:
-                return repr(obj)
+        return str(obj)
+
+# Shared encoders for report output; reusing them avoids per-call encoder setup
+_encoder = CustomJSONEncoder(indent=2, ensure_ascii=False)
+_compact_encoder = CustomJSONEncoder(ensure_ascii=False, separators=(',', ':'))
+
+_BUFFER_SIZE = 1 << 20
+
+def _orjson_dumps(value: Any, pretty: bool, newline: bytes = b'\n') -> bytes:
+    """orjson-encode a value, re-indenting pretty output nested under newline"""
+    if not pretty:
+        return orjson.dumps(value, default=_encoder.default, option=orjson.OPT_NON_STR_KEYS)
+    encoded = orjson.dumps(
+        value,
+        default=_encoder.default,
+        option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+    )
+    return encoded.replace(b'\n', newline) if newline != b'\n' else encoded
+
+def write_json(path: Path, data: Any, pretty: bool = True) -> None:
+    """Write UTF-8 JSON, indented or compact, without building the document as one str"""
+    if orjson is None:
+        encoder = _encoder if pretty else _compact_encoder
+        with path.open('w', encoding='utf-8') as f:
+            f.writelines(encoder.iterencode(data))
+        return
+    if not isinstance(data, dict) or not data:
+        path.write_bytes(_orjson_dumps(data, pretty))
+        return
+    # Emit the top-level object by hand and its lists one item at a time, so
+    # only one item (e.g. one PBO) is ever encoded in memory at once. The
+    # output matches encoding the whole document in one call.
+    outer, inner = (b'\n  ', b'\n    ') if pretty else (b'', b'')
+    with open(path, 'wb', buffering=_BUFFER_SIZE) as f:
+        f.write(b'{')
+        for i, (key, value) in enumerate(data.items()):
+            f.write(b',' + outer if i else outer)
+            f.write(_orjson_dumps(str(key), pretty))
+            f.write(b': ' if pretty else b':')
+            if isinstance(value, list) and value:
+                f.write(b'[')
+                for j, item in enumerate(value):
+                    f.write(b',' + inner if j else inner)
+                    f.write(_orjson_dumps(item, pretty, inner))
+                f.write(outer + b']')
+            else:
+                f.write(_orjson_dumps(value, pretty, outer))
+        f.write(b'\n}' if pretty else b'}')
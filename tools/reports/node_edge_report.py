@@ -1,58 +1,45 @@
+import csv
 import logging
 from pathlib import Path
-from typing import Set, Tuple
+from typing import Iterator, Set, Tuple
 from .types import ReportData
 
-def collect_edges(report_data: ReportData) -> Set[Tuple[str, str]]:
-    """Collect all class relationships as edges"""
-    edges = set()
-    
+def iter_edges(report_data: ReportData) -> Iterator[Tuple[str, str, str]]:
+    """Yield each unique (source, target, type) class relationship in encounter order"""
+    seen: Set[Tuple[str, str]] = set()
+
     for pbo in report_data.get("pbos", []):
         if not isinstance(pbo, dict) or not pbo.get("classes"):
             continue
-            
+
         for cls in pbo["classes"]:
-            if not isinstance(cls, dict) or not cls.get("name"):
+            if not cls.name:
                 continue
-                
-            source = cls["name"]
-            
+
+            source = cls.name
+            parent, container = cls.parent, cls.container
+
             # Add parent relationships
-            if cls.get("parent"):
-                edges.add((source, cls["parent"]))
-                
-            # Add container relationships
-            if cls.get("container"):
-                edges.add((source, cls["container"]))
-                
-    return edges
+            if parent and (source, parent) not in seen:
+                seen.add((source, parent))
+                yield source, parent, "inherits_from"
+
+            # Add container relationships; a container that is also the
+            # parent is reported once, as inheritance
+            if container and container != parent and (source, container) not in seen:
+                seen.add((source, container))
+                yield source, container, "contained_in"
 
 def create_node_edge_report(report_data: ReportData, output_path: Path) -> None:
     """Generate a node-edge CSV report for class relationships"""
     try:
-        # Collect all edges
-        edges = collect_edges(report_data)
-        
-        # Generate CSV content
-        lines = ["source;target;type"]
-        for source, target in sorted(edges):
-            # Determine relationship type based on the data
-            rel_type = "inherits_from"  # Default relationship type
-            
-            # Look up the actual relationship type
-            for pbo in report_data.get("pbos", []):
-                for cls in pbo.get("classes", []):
-                    if cls.get("name") == source:
-                        if cls.get("parent") == target:
-                            rel_type = "inherits_from"
-                        elif cls.get("container") == target:
-                            rel_type = "contained_in"
-                        break
-            
-            lines.append(f"{source};{target};{rel_type}")
-        
-        # Write the CSV file
-        output_path.write_text("\n".join(lines), encoding='utf-8')
-        
+        # Stream edges to disk as they are found; they appear in scan order
+        # (PBO, then class), which graph tools don't depend on, so the whole
+        # edge set is never held or sorted. csv quotes any field containing ';'
+        with output_path.open('w', encoding='utf-8', newline='') as f:
+            writer = csv.writer(f, delimiter=';', lineterminator='\n')
+            writer.writerow(("source", "target", "type"))
+            writer.writerows(iter_edges(report_data))
+
     except Exception as e:
         logging.error(f"Error writing node-edge report: {e}")
@@ -1,11 +1,63 @@
-import json
 import logging
+from itertools import repeat
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Optional
+from .json_encoder import _encoder, _orjson_dumps, orjson
 from .types import ReportData
 
-def create_structure_report(report_data: ReportData, output_dir: Path) -> None:
-    """Generate a folder structure mirroring the PBO organization"""
+
+def _dumps(data: Dict[str, Any]) -> bytes:
+    """Serialize to indented UTF-8 JSON, using orjson when available
+
+    Both paths share the report encoder's fallback for non-JSON types and
+    write non-ASCII characters unescaped, so the output doesn't depend on
+    whether orjson is installed.
+    """
+    if orjson is None:
+        return _encoder.encode(data).encode('utf-8')
+    return _orjson_dumps(data, pretty=True)
+
+def _write_one_pbo(pbo: Dict[str, Any], output_dir: Path) -> None:
+    """Write the classes.json of a single PBO into the addon folder structure"""
+    pbo_path = Path(pbo["name"])
+    
+    # Create addon folder structure
+    addon_name = pbo_path.parent.name
+    if addon_name.startswith('@'):
+        structure_path = output_dir / addon_name / pbo_path.stem
+    else:
+        structure_path = output_dir / f"@{addon_name}" / pbo_path.stem
+    
+    structure_path.mkdir(parents=True, exist_ok=True)
+
+    # Write class data
+    classes_file = structure_path / "classes.json"
+    class_data: Dict[str, Any] = {
+        "pbo_name": pbo["name"],
+        "class_count": pbo["class_count"],
+        "classes": {
+            cls.name: {
+                "parent": cls.parent,
+                "properties": cls.properties,
+                "config_type": cls.config_type,
+                "category": cls.category,
+                "display_name": cls.display_name
+            }
+            for cls in pbo["classes"]
+        }
+    }
+    
+    classes_file.write_bytes(_dumps(class_data))
+
+def create_structure_report(report_data: ReportData, output_dir: Path,
+                            max_workers: Optional[int] = 1) -> None:
+    """Generate a folder structure mirroring the PBO organization
+
+    PBO files are written one after another by default. They are
+    independent, so passing max_workers > 1 (or None for one per CPU)
+    writes them from a process pool instead, which only pays off for
+    large reports.
+    """
     try:
         if not report_data or not report_data.get("pbos"):
             return
@@ -13,39 +65,16 @@ def create_structure_report(report_data: ReportData, output_dir: Path) -> None:
         # Create base output directory
         output_dir.mkdir(parents=True, exist_ok=True)
 
-        for pbo in report_data["pbos"]:
-            pbo_path = Path(pbo["name"])
-            
-            # Create addon folder structure
-            addon_name = pbo_path.parent.name
-            if addon_name.startswith('@'):
-                structure_path = output_dir / addon_name / pbo_path.stem
-            else:
-                structure_path = output_dir / f"@{addon_name}" / pbo_path.stem
-            
-            structure_path.mkdir(parents=True, exist_ok=True)
-
-            # Write class data
-            classes_file = structure_path / "classes.json"
-            class_data: Dict[str, Any] = {
-                "pbo_name": pbo["name"],
-                "class_count": pbo["class_count"],
-                "classes": {
-                    cls["name"]: {
-                        "parent": cls.get("parent", ""),
-                        "properties": cls.get("properties", {}),
-                        "config_type": cls.get("config_type", "default"),
-                        "category": cls.get("category", "Uncategorized"),
-                        "display_name": cls.get("display_name", cls["name"])
-                    }
-                    for cls in pbo["classes"]
-                }
-            }
-            
-            classes_file.write_text(
-                json.dumps(class_data, indent=2),
-                encoding='utf-8'
-            )
+        pbos = report_data["pbos"]
+        if max_workers == 1:
+            for pbo in pbos:
+                _write_one_pbo(pbo, output_dir)
+            return
+
+        # Only pay for the executor machinery when a pool is actually used
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            list(executor.map(_write_one_pbo, pbos, repeat(output_dir), chunksize=8))
 
     except Exception as e:
         logging.error(f"Error creating structure report: {e}")
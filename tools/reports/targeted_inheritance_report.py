@@ -1,6 +1,7 @@
+import csv
 import logging
 from pathlib import Path
-from typing import List, Set, Tuple
+from typing import Dict, List
 from .types import ReportData
 from .inheritance_utils import InheritanceMapper
 
@@ -11,33 +12,33 @@ def create_targeted_inheritance_report(report_data: ReportData, root_classes: Li
         mapper = InheritanceMapper(report_data)
         root_classes_set = set(root_classes)  # Convert to set for faster lookups
 
-        valid_classes: Set[str] = set()
-        inheritance_edges: Set[Tuple[str, str]] = set()
+        # Every edge leaves a child towards its single parent, so edges are
+        # kept per child and sorting the children orders the edges
+        edges_by_child: Dict[str, str] = {}
 
-        # Process only classes that inherit from root classes
-        for class_name in mapper.reverse_map:
-            if mapper.inherits_from_any(class_name, root_classes_set):
-                chain = mapper.get_inheritance_chain(class_name)
-                valid_classes.add(class_name)
-                
-                # Build edges until we hit a root class
-                for i in range(len(chain) - 1):
-                    child, parent = chain[i], chain[i + 1]
-                    valid_classes.add(parent)
-                    inheritance_edges.add((child, parent))
-                    if parent in root_classes_set:
-                        break
+        # Walk down from the root classes instead of testing every class.
+        # Classes caught in inheritance loops only count as roots.
+        loops = mapper.get_inheritance_loops()
+        for class_name in mapper.descendants_of(root_classes_set):
+            if class_name not in loops and class_name not in root_classes_set:
+                edges_by_child[class_name] = mapper.reverse_map[class_name]
 
-        # Generate report
-        lines = ["source;target;root_distance;inheritance_path"]
-        
-        for child, parent in sorted(inheritance_edges):
-            chain = mapper.get_inheritance_chain(child)
-            distance = len(chain) - 1
-            path_str = " -> ".join(chain)
-            lines.append(f"{child};{parent};{distance};{path_str}")
+        # Roots that have parents of their own keep their ancestry up to the next root
+        for root in root_classes_set & mapper.reverse_map.keys():
+            chain = mapper.get_inheritance_chain(root)
+            for i in range(len(chain) - 1):
+                child, parent = chain[i], chain[i + 1]
+                edges_by_child[child] = parent
+                if parent in root_classes_set:
+                    break
 
-        output_path.write_text("\n".join(lines), encoding='utf-8')
+        # Write the CSV row by row
+        with output_path.open('w', encoding='utf-8', newline='') as f:
+            writer = csv.writer(f, delimiter=';', lineterminator='\n')
+            writer.writerow(("source", "target", "root_distance", "inheritance_path"))
+            for child in sorted(edges_by_child):
+                chain = mapper.get_inheritance_chain(child)
+                writer.writerow((child, edges_by_child[child], len(chain) - 1, " -> ".join(chain)))
 
     except Exception as e:
         logging.error(f"Error writing targeted inheritance report: {e}")
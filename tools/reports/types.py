@@ -1,14 +1,49 @@
-from typing import Dict, Any, List, TypedDict, Optional
+from dataclasses import dataclass
+from typing import Dict, Any, List, Tuple, TypedDict, Optional
 
-class ClassInfo(TypedDict):
+# Report records are created once per class / property and never changed;
+# slotted frozen dataclasses keep large scans small in memory
+
+@dataclass(slots=True, frozen=True)
+class PropInfo:
+    value: Any
+    raw_value: Any
+    type: Optional[str]
+    is_array: bool = False
+    array_values: Tuple[Any, ...] = ()
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to serializable dictionary"""
+        return {
+            'value': self.value,
+            'raw_value': self.raw_value,
+            'type': self.type,
+            'is_array': self.is_array,
+            'array_values': self.array_values
+        }
+
+@dataclass(slots=True, frozen=True)
+class ClassInfo:
     name: str
     parent: str
-    properties: Dict[str, Any]
+    properties: Dict[str, PropInfo]
     config_type: str
-    category: str
+    category: Optional[str]
     container: str
     display_name: Optional[str]
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to serializable dictionary"""
+        return {
+            'name': self.name,
+            'parent': self.parent,
+            'properties': self.properties,
+            'config_type': self.config_type,
+            'category': self.category,
+            'container': self.container,
+            'display_name': self.display_name
+        }
+
 class PboInfo(TypedDict):
     name: str
     class_count: int
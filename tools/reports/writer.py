@@ -0,0 +1,16 @@
+from itertools import islice
+from pathlib import Path
+from typing import Iterable
+
+# Large write buffer: reports are written once, front to back
+_BUFFER_SIZE = 1 << 20
+_BATCH_SIZE = 4096
+
+def write_lines(output_path: Path, lines: Iterable[str]) -> None:
+    """Write newline-separated lines as UTF-8, encoding them in batches"""
+    it = iter(lines)
+    with open(output_path, 'wb', buffering=_BUFFER_SIZE) as f:
+        separator = b''
+        while batch := list(islice(it, _BATCH_SIZE)):
+            f.write(separator + '\n'.join(batch).encode('utf-8'))
+            separator = b'\n'
@@ -1,22 +1,110 @@
 import argparse
+import hashlib
 import json
 import logging
+import os
 import signal
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import tempfile
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from datetime import datetime
+from operator import attrgetter
 from pathlib import Path
 import sys
-from typing import Dict, Any, List, Optional
+import time
+from typing import Dict, Any, Iterator, List, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from class_scanner.api import ClassAPI
-from reports.types import ClassInfo, PboInfo, ReportData
-from reports.json_encoder import CustomJSONEncoder
+from class_scanner.models import PboScanData
+from class_scanner.scanner import Scanner, find_pbo_files
+from reports.types import ClassInfo, PboInfo, PropInfo, ReportData
+from reports.json_encoder import write_json
 from reports.class_list_report import create_class_list_report
 from reports.targeted_inheritance_report import create_targeted_inheritance_report
 from reports.structure_report import create_structure_report
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+def _iter_pbos(root: Path) -> Iterator[Tuple[Path, os.stat_result]]:
+    """Yield *.pbo files below root with their stat, skipping unreadable ones"""
+    try:
+        entries = find_pbo_files(root)
+    except OSError:
+        return
+    for entry in entries:
+        # DirEntry caches its stat, so this is the only one per PBO
+        try:
+            st = entry.stat()
+        except OSError:
+            continue
+        yield Path(entry.path), st
+
+# Every scanned property is a PropertyValue, so one attrgetter call reads
+# all fields; anything else takes the per-attribute fallback
+_prop_fields = attrgetter('value', 'raw_value', 'value_type', 'is_array', 'array_values')
+
+def _intern(value: Any) -> Any:
+    """Intern string values, passing anything else (e.g. None) through"""
+    return sys.intern(value) if type(value) is str else value
+
+def _build_prop_info(prop: Any) -> PropInfo:
+    """Convert a scanned property value into report format"""
+    try:
+        value, raw_value, value_type, is_array, array_values = _prop_fields(prop)
+    except AttributeError:
+        value = getattr(prop, 'value', None)
+        raw_value = getattr(prop, 'raw_value', None)
+        value_type = getattr(prop, 'value_type', None)
+        is_array = getattr(prop, 'is_array', False)
+        array_values = getattr(prop, 'array_values', ())
+    return PropInfo(
+        value=value,
+        raw_value=raw_value,
+        type=value_type.name if value_type else None,
+        is_array=is_array,
+        array_values=array_values
+    )
+
+# Part of every on-disk cache key; bump it whenever the scanner or parser
+# output changes so stale entries are never served
+_DISK_CACHE_VERSION = 2
+
+# Optional class fields read by ReportGenerator.build_class_info (display_name
+# is a computed property on ClassData, so it is read separately)
+_CLASS_FIELDS = ('parent', 'config_type', 'category', 'container')
+
+# Scanner owned by the current worker. Thread-local so thread-pool workers
+# don't share one scanner's parser and caches; a process-pool worker runs
+# its tasks on one thread and so gets one scanner per process.
+_worker = threading.local()
+
+# (PBO, scan result, error message) as returned by a pool worker
+ScanOutcome = Tuple[Path, Optional[PboScanData], Optional[str]]
+
+def _scan_chunk(pbo_files: List[Path]) -> List[ScanOutcome]:
+    """Pool entry point: scan a chunk of PBOs with this worker's scanner
+
+    Failures are reported per PBO, so one bad file doesn't cost the rest
+    of its chunk.
+    """
+    scanner = getattr(_worker, 'scanner', None)
+    if scanner is None:
+        # Each PBO is scanned once per run, so a result cache would only
+        # hold memory
+        scanner = _worker.scanner = Scanner(cache_size=0)
+    outcomes: List[ScanOutcome] = []
+    for pbo_file in pbo_files:
+        try:
+            outcomes.append((pbo_file, scanner.scan_pbo(pbo_file), None))
+        except Exception as e:
+            outcomes.append((pbo_file, None, str(e)))
+    return outcomes
+
 class GracefulInterruptHandler:
     def __init__(self):
         self.interrupted = False
@@ -52,30 +140,94 @@ class GracefulInterruptHandler:
         return True
 
 class ReportGenerator:
-    def __init__(self, cache_dir: Optional[Path] = None, max_workers: int = 16):
+    # Terminal writes are throttled to this many seconds apart; the final
+    # update is always shown
+    PROGRESS_INTERVAL = 0.05
+    PROGRESS_FORMAT = ("\r[{done}/{total}] Processing: {name:<50} "
+                       "(Complete: {completed}, Cached: {cached}, Errors: {errors})")
+
+    def __init__(self, cache_dir: Optional[Path] = None, max_workers: Optional[int] = None,
+                 executor: str = "process", use_disk_cache: bool = True):
         self.max_workers = max_workers
+        self.executor = executor
         self.api = ClassAPI(cache_dir=cache_dir)
+        # Per-PBO JSON entries keyed by size+mtime, so unchanged PBOs skip parsing
+        # on the next run
+        self.disk_cache_dir = cache_dir if use_disk_cache else None
         self._scanned = 0
         self._total = 0
         self._completed = 0
         self._errors = 0
         self._cached = 0
+        self._last_progress = 0.0
         self.interrupt_handler = GracefulInterruptHandler()
 
     def _progress_callback(self, msg: str) -> None:
         """Progress callback for individual PBO scanning"""
         self._scanned += 1
-        print(f"\r[{self._completed + self._cached}/{self._total}] "
-              f"Processing: {Path(msg).name:<50} "
-              f"(Complete: {self._completed}, Cached: {self._cached}, Errors: {self._errors})", 
-              end="", flush=True)
+        done = self._completed + self._cached
+        now = time.monotonic()
+        # Failed scans don't count as done, so track the last PBO separately
+        last = self._scanned + self._cached >= self._total
+        if not last and now - self._last_progress < self.PROGRESS_INTERVAL:
+            return
+        self._last_progress = now
+        sys.stdout.write(self.PROGRESS_FORMAT.format(
+            done=done, total=self._total, name=msg[msg.rfind(os.sep) + 1:],
+            completed=self._completed, cached=self._cached, errors=self._errors))
+        sys.stdout.flush()
+
+    def _disk_cache_path(self, pbo_file: Path, st: os.stat_result) -> Optional[Path]:
+        """Location of the on-disk scan result for the PBO's path and current size and mtime"""
+        if self.disk_cache_dir is None:
+            return None
+        key = f"{_DISK_CACHE_VERSION}:{os.path.realpath(pbo_file)}:{st.st_size}:{st.st_mtime_ns}"
+        return self.disk_cache_dir / (hashlib.blake2b(key.encode(), digest_size=16).hexdigest() + '.json')
+
+    def _load_disk_cached(self, cache_path: Optional[Path]) -> Optional[PboScanData]:
+        """Load a cached scan result, treating unreadable entries as misses"""
+        if cache_path is None:
+            return None
+        try:
+            # Plain data only: the cache directory is user-supplied, so
+            # nothing read from it may execute code (as unpickling could)
+            data = cache_path.read_bytes()
+            return PboScanData.from_dict(orjson.loads(data) if orjson is not None else json.loads(data))
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logging.debug(f"Ignoring unreadable cache entry {cache_path}: {e}")
+            return None
+
+    def _store_disk_cached(self, cache_path: Optional[Path], result: PboScanData) -> None:
+        """Save a scan result for reuse while the PBO is unchanged"""
+        if cache_path is None:
+            return
+        tmp_path = None
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            data = result.to_dict()
+            payload = orjson.dumps(data) if orjson is not None else json.dumps(data).encode('utf-8')
+            # Write beside the target and rename over it, so an interrupted
+            # write never leaves a truncated entry behind
+            fd, tmp_path = tempfile.mkstemp(dir=cache_path.parent, suffix='.tmp')
+            with os.fdopen(fd, 'wb') as f:
+                f.write(payload)
+            os.replace(tmp_path, cache_path)
+        except Exception as e:
+            logging.debug(f"Failed to write cache entry {cache_path}: {e}")
+            if tmp_path is not None:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
 
     def scan_directories(self, scan_paths: List[Path]) -> Dict[Path, Any]:
-        """Scan multiple directories using multithreaded ClassAPI scanning"""
+        """Scan multiple directories, parsing uncached PBOs in a worker pool"""
         # Collect all PBO files first
-        pbo_files: List[Path] = []
+        pbo_files: List[Tuple[Path, os.stat_result]] = []
         for path in scan_paths:
-            pbo_files.extend(path.rglob("*.pbo"))
+            pbo_files.extend(_iter_pbos(path))
 
         if not pbo_files:
             print("No PBOs found in any directory!")
@@ -88,50 +240,90 @@ class ReportGenerator:
         self._cached = 0
         
         print(f"\nFound {self._total} PBOs to process")
-        print(f"Starting scan with {self.max_workers} threads...")
 
-        # Set up progress tracking
-        self.api.set_progress_callback(self._progress_callback)
-
-        # Process PBOs in parallel
+        # Cache hits are served here; only the misses go to the pool
         results: Dict[Path, Any] = {}
+        pending: List[Tuple[Path, os.stat_result]] = []
+        cache_paths: Dict[Path, Optional[Path]] = {}
+        for pbo_file, st in pbo_files:
+            cached = self.api.get_cached(pbo_file)
+            if not cached:
+                cache_paths[pbo_file] = cache_path = self._disk_cache_path(pbo_file, st)
+                if cached := self._load_disk_cached(cache_path):
+                    self.api.add_result(pbo_file, cached)
+            if cached:
+                results[pbo_file] = cached
+                self._cached += 1
+            else:
+                pending.append((pbo_file, st))
+
+        if not pending:
+            return self._finish_scan(results)
+
+        # Parsing is CPU-bound, so processes scale where threads hit the GIL
+        max_workers = self.max_workers or min(os.cpu_count() or 1, len(pending))
+        pool_type = ProcessPoolExecutor if self.executor == "process" else ThreadPoolExecutor
+        print(f"Starting scan with {max_workers} {self.executor} workers...")
+
+        # Largest PBOs first, so the longest scans don't start last
+        pending.sort(key=lambda item: item[1].st_size, reverse=True)
+        pending_files = [pbo_file for pbo_file, _ in pending]
+
+        # Hand out work in chunks: one future per PBO is noticeable overhead
+        # on scans of many small PBOs. Chunks are strided so each one mixes
+        # large and small PBOs.
+        chunk_count = min(len(pending_files), max_workers * 4)
+        chunks = [pending_files[i::chunk_count] for i in range(chunk_count)]
 
         with self.interrupt_handler:
-            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-                # Create futures for each PBO file
-                future_to_pbo = {
-                    executor.submit(self.api.scan, pbo_file): pbo_file 
-                    for pbo_file in pbo_files
-                }
-
+            with pool_type(max_workers=max_workers) as executor:
+                future_to_chunk = {executor.submit(_scan_chunk, chunk): chunk for chunk in chunks}
                 try:
-                    # Process completed scans
-                    for future in as_completed(future_to_pbo):
+                    # Process chunks as they complete
+                    for future in as_completed(future_to_chunk):
                         if self.interrupt_handler.interrupted:
                             print("\nScan interrupted. Partial results will be saved.")
-                            executor.shutdown(wait=False)
+                            executor.shutdown(wait=False, cancel_futures=True)
                             break
 
-                        pbo_file = future_to_pbo[future]
                         try:
-                            if scan_result := future.result():
+                            outcomes = future.result()
+                        except Exception as e:
+                            # The whole chunk was lost (e.g. a crashed worker
+                            # or an unpicklable result)
+                            chunk = future_to_chunk[future]
+                            self._errors += len(chunk)
+                            print(f"\nScan worker failed, {len(chunk)} PBOs not scanned: {e}", file=sys.stderr)
+                            continue
+
+                        for pbo_file, scan_result, error in outcomes:
+                            if error is not None:
+                                self._errors += 1
+                                print(f"\nError scanning {pbo_file}: {error}", file=sys.stderr)
+                            elif scan_result:
+                                self.api.add_result(pbo_file, scan_result)
+                                self._store_disk_cached(cache_paths.get(pbo_file), scan_result)
                                 results[pbo_file] = scan_result
                                 self._completed += 1
-                        except Exception as e:
-                            self._errors += 1
-                            print(f"\nError scanning {pbo_file}: {e}", file=sys.stderr)
+                            self._progress_callback(str(pbo_file))
 
                 except KeyboardInterrupt:
                     print("\nReceived interrupt signal. Shutting down...", file=sys.stderr)
-                    executor.shutdown(wait=False)
+                    executor.shutdown(wait=False, cancel_futures=True)
                     return results
 
+        return self._finish_scan(results)
+
+    def _finish_scan(self, results: Dict[Path, Any]) -> Dict[Path, Any]:
+        """Print final scan statistics and return the results"""
         # Print final statistics
         print("\n\nScan completed:")
         print(f"  Successfully processed: {self._completed}")
         print(f"  Retrieved from cache:  {self._cached}")
         print(f"  Errors encountered:    {self._errors}")
         print(f"  Total PBOs:           {self._total}")
+        if unscanned := self._total - self._cached - self._scanned:
+            print(f"  Not scanned:          {unscanned}")
 
         if self.interrupt_handler.interrupted:
             print("  Note: Scan was interrupted - results are incomplete")
@@ -140,23 +332,28 @@ class ReportGenerator:
 
     def build_class_info(self, class_name: str, class_data: Any) -> ClassInfo:
         """Convert raw class data into report format"""
-        return {
-            "name": class_name,
-            "parent": getattr(class_data, 'parent', ''),
-            "properties": {
-                name: {
-                    'value': prop.value if hasattr(prop, 'value') else None,
-                    'raw_value': prop.raw_value if hasattr(prop, 'raw_value') else None,
-                    'type': prop.value_type.name if hasattr(prop, 'value_type') else None,
-                    'is_array': prop.is_array if hasattr(prop, 'is_array') else False,
-                    'array_values': prop.array_values if hasattr(prop, 'array_values') else []
-                } for name, prop in class_data.properties.items()
+        # ClassData keeps its fields in __dict__, so read them from there
+        # instead of one getattr per field; slotted objects fall back
+        try:
+            fields = class_data.__dict__
+        except AttributeError:
+            fields = {
+                field: getattr(class_data, field)
+                for field in _CLASS_FIELDS if hasattr(class_data, field)
+            }
+        # Names and low-cardinality fields repeat across thousands of classes
+        # (and arrive un-interned from worker processes); keep one copy each
+        return ClassInfo(
+            name=sys.intern(class_name),
+            parent=_intern(fields.get('parent', '')),
+            properties={
+                sys.intern(name): _build_prop_info(prop) for name, prop in class_data.properties.items()
             },
-            "config_type": getattr(class_data, 'config_type', 'default'),
-            "category": getattr(class_data, 'category', 'Uncategorized'),
-            "container": getattr(class_data, 'container', ''),
-            "display_name": getattr(class_data, 'display_name', class_name)
-        }
+            config_type=_intern(fields.get('config_type', 'default')),
+            category=_intern(fields.get('category', 'Uncategorized')),
+            container=_intern(fields.get('container', '')),
+            display_name=getattr(class_data, 'display_name', class_name)
+        )
 
     def build_report_data(self, scan_results: Dict[Path, Any]) -> Optional[ReportData]:
         """Generate report data structure from scan results"""
@@ -171,10 +368,15 @@ class ReportGenerator:
             if not hasattr(pbo_data, 'classes') or not pbo_data.classes:
                 continue
 
-            classes = []
-            for class_name, class_data in sorted(pbo_data.classes.items()):
+            # Classes keep the scanner's source order; the text reports that
+            # need alphabetical order sort for themselves. Properties are
+            # counted in the same pass.
+            classes: List[ClassInfo] = []
+            for class_name, class_data in pbo_data.classes.items():
                 if class_data:
-                    classes.append(self.build_class_info(class_name, class_data))
+                    class_info = self.build_class_info(class_name, class_data)
+                    classes.append(class_info)
+                    total_properties += len(class_info.properties)
 
             pbo_info: PboInfo = {
                 "name": pbo_path.name,
@@ -184,7 +386,8 @@ class ReportGenerator:
             pbos.append(pbo_info)
 
             total_classes += len(classes)
-            total_properties += sum(len(cls["properties"]) for cls in classes)
+
+        pbos.sort(key=lambda pbo: pbo["name"])
 
         return {
             "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
@@ -218,21 +421,19 @@ class ReportGenerator:
         print(f"{'Total Classes:':<20} {report_data['total_classes']}")
         print(f"{'Total Properties:':<20} {report_data['total_properties']}")
 
-    def generate_reports(self, report_data: ReportData, output_dir: Path, root_classes: Optional[List[str]] = None) -> None:
+    def generate_reports(self, report_data: ReportData, output_dir: Path, root_classes: Optional[List[str]] = None,
+                         pretty_json: bool = False, structure_workers: Optional[int] = 1) -> None:
         """Generate all report files"""
         try:
             output_dir.mkdir(parents=True, exist_ok=True)
 
-            # Write main JSON report
+            # Write main JSON report; it is machine-read, so compact unless asked
             json_path = output_dir / "report.json"
-            json_path.write_text(
-                json.dumps(report_data, indent=2, cls=CustomJSONEncoder),
-                encoding='utf-8'
-            )
+            write_json(json_path, report_data, pretty=pretty_json)
 
             # Generate structure report
             structure_dir = output_dir / "structure"
-            create_structure_report(report_data, structure_dir)
+            create_structure_report(report_data, structure_dir, max_workers=structure_workers)
 
             # Generate other reports
             create_class_list_report(report_data, output_dir / "class_list.txt")
@@ -257,7 +458,15 @@ def main():
     parser.add_argument("scan_paths", type=Path, nargs='+', help="Directories to scan for PBOs")
     parser.add_argument("--output", "-o", type=Path, default=Path("reports"), help="Output directory for reports")
     parser.add_argument("--cache-dir", "-c", type=Path, help="Cache directory for scan results")
-    parser.add_argument("--threads", "-t", type=int, default=16, help="Number of scanner threads")
+    parser.add_argument("--workers", "--threads", "-t", type=int, default=None,
+                        help="Number of scanner workers (default: one per CPU, capped at the PBO count)")
+    parser.add_argument("--executor", choices=("process", "thread"), default="process",
+                        help="Run scans in worker processes (CPU-bound parsing) or threads")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Rescan every PBO instead of reusing results cached in --cache-dir")
+    parser.add_argument("--pretty", action="store_true", help="Indent report.json for reading")
+    parser.add_argument("--structure-workers", type=int, default=1,
+                        help="Processes writing the structure report (default: 1; 0 for one per CPU)")
     parser.add_argument("--verbose", "-v", action="store_true", help="Enable verbose logging")
     parser.add_argument("--root-classes", "-r", type=str, nargs="+", help="Root classes for inheritance report")
 
@@ -267,7 +476,8 @@ def main():
         logging.basicConfig(level=logging.DEBUG)
 
     try:
-        generator = ReportGenerator(cache_dir=args.cache_dir, max_workers=args.threads)
+        generator = ReportGenerator(cache_dir=args.cache_dir, max_workers=args.workers, executor=args.executor,
+                                    use_disk_cache=not args.no_cache)
 
         print("\nScanning directories:")
         for path in args.scan_paths:
@@ -280,7 +490,8 @@ def main():
 
         report_data = generator.build_report_data(results)
         if report_data:
-            generator.generate_reports(report_data, args.output, args.root_classes)
+            generator.generate_reports(report_data, args.output, args.root_classes, pretty_json=args.pretty,
+                                       structure_workers=args.structure_workers or None)
 
     except KeyboardInterrupt:
         print("\nProcess terminated by user", file=sys.stderr)